@@ -1,13 +1,37 @@
 import os
+from functools import cache, lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from the package directory
 _package_dir = Path(__file__).parent
-load_dotenv(_package_dir / ".env")
 
-class Config:
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load environment variables from the package .env file exactly once."""
+    return load_dotenv(_package_dir / ".env")
+
+
+class _LazyEnvConfig(type):
+    """Metaclass that resolves environment-backed settings on first access.
+
+    Importing the config module does no file I/O; the .env file is read the
+    first time an environment-backed attribute such as Config.GEMINI_API_KEY
+    is looked up.
+    """
+
+    def __getattr__(cls, name: str):
+        # Only reached for attributes not (yet) set on the class
+        if name.startswith("_"):
+            raise AttributeError(name)
+        cls.load()
+        try:
+            return vars(cls)[name]
+        except KeyError:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'") from None
+
+
+class Config(metaclass=_LazyEnvConfig):
     GEMINI_VERSION = "v1beta"  # Required for response_mime_type, systemInstruction, thinkingConfig
     MODEL_NAME_TEXT = "gemini-3-pro-preview" # gemini-3-pro-preview gemini-2.5-flash
     MODEL_NAME_IMAGE = "gemini-3-pro-image-preview" # gemini-2.5-flash-image gemini-3-pro-image-preview
@@ -16,19 +40,65 @@ class Config:
     OUTPUT_DIR = "output/shorts"
     PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "prompts")
     REFERENCE_IMAGES_DIR = os.path.join(PROMPTS_DIR, "reference_images")
+    KEYFRAME_CACHE_DIR = os.path.join(OUTPUT_DIR, ".keyframe_cache")
+    PLAN_CACHE_DIR = os.path.join(OUTPUT_DIR, ".plan_cache")
+
+    @classmethod
+    @cache
+    def load(cls) -> type:
+        """Read .env and populate environment-backed settings (once per process).
+
+        Values already assigned on the class (e.g. Config.SCENE_VARIETY set by
+        the web UI before first use) are kept.
+        """
+        _load_env()
+        settings = {
+            "GEMINI_API_KEY": os.getenv("GEMINI_API_KEY"),
+
+            # CSV Batch Processing
+            "CSV_INPUT_PATH": os.getenv("CSV_INPUT_PATH", None),
+            "CSV_AUTO_UPDATE": os.getenv("CSV_AUTO_UPDATE", "true").lower() == "true",
+            "CSV_CREATE_BACKUP": os.getenv("CSV_CREATE_BACKUP", "true").lower() == "true",
+            # Completed rows buffered before the CSV is updated (always flushed at batch end).
+            # Values above 1 save rewrites, but rows completed since the last update are
+            # regenerated on the next run if the process is killed.
+            "CSV_FLUSH_EVERY": max(1, int(os.getenv("CSV_FLUSH_EVERY", "1"))),
+            # Number of CSV rows generated concurrently (1 = sequential)
+            "BATCH_CONCURRENCY": max(1, int(os.getenv("BATCH_CONCURRENCY", "1"))),
+
+            # Write per-step state snapshots to logs/run_<id>/state.jsonl
+            "SAVE_STATE": os.getenv("SAVE_STATE", "true").lower() == "true",
+
+            # Generate keyframes B, C, ... concurrently, each edited from Keyframe A only
+            # (default: sequential chain where every edit sees the previous keyframe)
+            "PARALLEL_KEYFRAMES": os.getenv("PARALLEL_KEYFRAMES", "false").lower() == "true",
+
+            # Rows of a CSV batch planned ahead of the row being generated
+            "PLAN_BATCH_CONCURRENCY": max(1, int(os.getenv("PLAN_BATCH_CONCURRENCY", "4"))),
+
+            # Reuse the director plan from output/shorts/.plan_cache when the exact same
+            # request and system instruction were planned before
+            "PLAN_CACHE": os.getenv("PLAN_CACHE", "false").lower() == "true",
+
+            # Keyframe file format: "png" (as returned by the model) or "webp" (lossless, smaller)
+            "KEYFRAME_FORMAT": os.getenv("KEYFRAME_FORMAT", "png").lower(),
+
+            # Reference pose variants generated at once by agenerate_assets_batch
+            "POSE_BATCH_CONCURRENCY": max(1, int(os.getenv("POSE_BATCH_CONCURRENCY", "4"))),
+
+            # Reuse keyframes from output/shorts/.keyframe_cache when the exact same
+            # request (prompts, reference pose, earlier keyframes) was generated before
+            "KEYFRAME_CACHE": os.getenv("KEYFRAME_CACHE", "false").lower() == "true",
+
+            # Scene Variety Control (0-10 scale)
+            "SCENE_VARIETY": int(os.getenv("SCENE_VARIETY", "5")),
+        }
+        for name, value in settings.items():
+            if name not in vars(cls):
+                setattr(cls, name, value)
+        return cls
 
-    
-    # CSV Batch Processing
-    CSV_INPUT_PATH = os.getenv("CSV_INPUT_PATH", None)
-    CSV_AUTO_UPDATE = os.getenv("CSV_AUTO_UPDATE", "true").lower() == "true"
-    CSV_CREATE_BACKUP = os.getenv("CSV_CREATE_BACKUP", "true").lower() == "true"
-    
-    # Scene Variety Control (0-10 scale)
-    SCENE_VARIETY = int(os.getenv("SCENE_VARIETY", "5"))
-    
     @classmethod
     def validate(cls):
         if not cls.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable is not set.")
-
-
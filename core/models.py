@@ -1,8 +1,13 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+import sys
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class Scene(BaseModel):
     """Represents a single scene in the dance video."""
+    # Plans are read-only once parsed from the LLM response; frozen instances can be
+    # shared across services (and threads) without defensive copies.
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     scene_number: int
     action_description: str = Field(description="Description of movement for video generation (e.g., 'Leader spins follower')")
     audio_prompt: str = Field(description="Music/SFX prompt for Veo (e.g., 'Heels on wood, Spanish guitar, 120bpm')")
@@ -11,9 +16,11 @@ class Scene(BaseModel):
 
 class VideoPlan(BaseModel):
     """Represents the complete plan for the dance video."""
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     title: str
     description: str = Field(description="YouTube Short description with 5 hashtags and emojis")
-    backend_tags: List[str]
+    backend_tags: Tuple[str, ...]
     # The Director must define the Visual Style once for consistency
     character_leader_desc: str
     character_follower_desc: str
@@ -33,20 +40,39 @@ class MetadataOption(BaseModel):
     """A single metadata option with title, description, and tags."""
     title: str
     description: str = Field(description="YouTube Short description with hashtags and emojis")
-    tags: List[str]
+    tags: Tuple[str, ...]
     emotional_hook: str = Field(description="The emotional response this option targets")
     text_hook: str = Field(description="Attention-grabbing text hook for the video overlay")
-    text_overlay: List[str] = Field(description="Progressive text overlay snippets for the video")
+    text_overlay: Tuple[str, ...] = Field(description="Progressive text overlay snippets for the video")
 
 
 class MetadataAlternatives(BaseModel):
     """Three alternative metadata options for the video."""
-    option_1: MetadataOption
-    option_2: MetadataOption
-    option_3: MetadataOption
+    options: List[MetadataOption] = Field(
+        min_length=3, max_length=3,
+        description="Exactly three distinct metadata options, in order",
+    )
     recommended: int = Field(default=1, ge=1, le=3)
     reasoning: str = Field(description="Strategic explanation for the recommendation")
 
+    @property
+    def recommended_option(self) -> MetadataOption:
+        """The option selected by the 1-based `recommended` index."""
+        return self.options[self.recommended - 1]
+
+    # Read-only aliases kept for callers written against the numbered fields
+    @property
+    def option_1(self) -> MetadataOption:
+        return self.options[0]
+
+    @property
+    def option_2(self) -> MetadataOption:
+        return self.options[1]
+
+    @property
+    def option_3(self) -> MetadataOption:
+        return self.options[2]
+
 
 class MetadataConfig(BaseModel):
     """User configuration for metadata generation."""
@@ -72,9 +98,20 @@ class CSVRow(BaseModel):
     # Store original row index for updating CSV
     row_index: int = Field(default=-1, exclude=True)
     
-    class Config:
-        populate_by_name = True
+    # Validator construction is deferred until the first row is read, so single-video
+    # runs that never touch a CSV don't pay for it.
+    model_config = ConfigDict(
+        populate_by_name=True,
+        defer_build=True,
+        extra="ignore",
+        str_strip_whitespace=True,
+    )
 
+    @field_validator("style", "music", "duration")
+    @classmethod
+    def _intern_categorical(cls, value: str) -> str:
+        """Share one string object per distinct style/music/duration across a batch."""
+        return sys.intern(value)
 
 
 class CSVBatchConfig(BaseModel):
@@ -82,3 +119,9 @@ class CSVBatchConfig(BaseModel):
     csv_path: str
     process_uncreated_only: bool = Field(default=True)
     update_created_flag: bool = Field(default=True)
+
+
+# JSON schemas sent to Gemini as response_json_schema. Schema generation is pure
+# for a given model class, so it runs once at import instead of once per request.
+VIDEO_PLAN_JSON_SCHEMA = VideoPlan.model_json_schema()
+METADATA_ALTERNATIVES_JSON_SCHEMA = MetadataAlternatives.model_json_schema()
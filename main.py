@@ -5,26 +5,30 @@ Services are responsible for their own logic, and main.py only coordinates.
 """
 
 import sys
-from google import genai
+from typing import TYPE_CHECKING
 from dance_loop_gen.config import Config
-from dance_loop_gen.services.director import DirectorService
-from dance_loop_gen.services.cinematographer import CinematographerService
-from dance_loop_gen.services.veo import VeoService
-from dance_loop_gen.services.seo_specialist import SEOSpecialistService
-from dance_loop_gen.services.batch_orchestrator import BatchOrchestrator
-from dance_loop_gen.services.video_processor import VideoProcessor
-from dance_loop_gen.services.report_service import ReportService
 from dance_loop_gen.utils.prompt_loader import PromptLoader
 from dance_loop_gen.utils.logger import setup_logger, save_state, get_run_dir, console
+from dance_loop_gen.utils.genai_client import create_client
 from rich.panel import Panel
-from rich.table import Table
 from rich.rule import Rule
 
+# Service modules pull in google-genai, pydantic schemas and openpyxl. They are
+# imported where they are first needed so configuration errors fail fast.
+if TYPE_CHECKING:
+    from google import genai
+    from dance_loop_gen.services.director import DirectorService
+    from dance_loop_gen.services.cinematographer import CinematographerService
+    from dance_loop_gen.services.veo import VeoService
+    from dance_loop_gen.services.seo_specialist import SEOSpecialistService
+    from dance_loop_gen.services.batch_orchestrator import BatchOrchestrator
+    from dance_loop_gen.services.report_service import ReportService
+
 # Initialize logger
 logger = setup_logger()
 
 
-def initialize_services(client: genai.Client) -> tuple:
+def initialize_services(client: "genai.Client") -> tuple:
     """Initialize all required services.
     
     Args:
@@ -33,6 +37,13 @@ def initialize_services(client: genai.Client) -> tuple:
     Returns:
         Tuple of (director, cinematographer, veo, seo_specialist, batch_orchestrator)
     """
+    from dance_loop_gen.services.director import DirectorService
+    from dance_loop_gen.services.cinematographer import CinematographerService
+    from dance_loop_gen.services.veo import VeoService
+    from dance_loop_gen.services.seo_specialist import SEOSpecialistService
+    from dance_loop_gen.services.batch_orchestrator import BatchOrchestrator
+    from dance_loop_gen.services.report_service import ReportService
+
     with console.status("[bold blue]Initializing services...", spinner="dots"):
         director = DirectorService(client)
         cinematographer = CinematographerService(client)
@@ -109,11 +120,11 @@ def load_base_user_request() -> str:
 
 def run_single_mode(
     base_user_request: str,
-    director: DirectorService,
-    cinematographer: CinematographerService,
-    veo: VeoService,
-    seo_specialist: SEOSpecialistService,
-    report_service: ReportService
+    director: "DirectorService",
+    cinematographer: "CinematographerService",
+    veo: "VeoService",
+    seo_specialist: "SEOSpecialistService",
+    report_service: "ReportService"
 ):
     """Run application in single video generation mode.
     
@@ -125,6 +136,8 @@ def run_single_mode(
         seo_specialist: SEO Specialist service instance
         report_service: Report service instance
     """
+    from dance_loop_gen.services.video_processor import VideoProcessor
+
     logger.info("=" * 60)
     logger.info("SINGLE PROCESSING MODE")
     logger.info("=" * 60)
@@ -162,7 +175,7 @@ def run_single_mode(
 
 def run_batch_mode(
     base_user_request: str,
-    batch_orchestrator: BatchOrchestrator
+    batch_orchestrator: "BatchOrchestrator"
 ):
     """Run application in batch processing mode.
     
@@ -170,6 +183,8 @@ def run_batch_mode(
         base_user_request: Base user request template
         batch_orchestrator: Batch orchestrator service instance
     """
+    from dance_loop_gen.services.video_processor import VideoProcessor
+
     csv_path = batch_orchestrator.resolve_csv_path(Config.CSV_INPUT_PATH)
     
     if not csv_path:
@@ -209,7 +224,7 @@ def main():
     # Step 2: Initialize Gemini Client
     logger.info("Initializing Gemini client...")
     logger.debug(f"API version: {Config.GEMINI_VERSION}")
-    client = genai.Client(http_options={'api_version': Config.GEMINI_VERSION})
+    client = create_client()
     logger.info("Gemini client initialized successfully")
     
     # Step 3: Initialize Services
@@ -5,17 +5,21 @@ following the Single Responsibility Principle by separating batch logic from mai
 """
 
 import os
-from typing import Optional, List, TYPE_CHECKING
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, Optional, List, TYPE_CHECKING
 from dance_loop_gen.config import Config
-from dance_loop_gen.core.models import CSVRow
+from dance_loop_gen.core.models import CSVRow, VideoPlan
 from dance_loop_gen.services.director import DirectorService
 from dance_loop_gen.services.cinematographer import CinematographerService
 from dance_loop_gen.services.veo import VeoService
 from dance_loop_gen.services.seo_specialist import SEOSpecialistService
 if TYPE_CHECKING:
     from dance_loop_gen.services.report_service import ReportService
-from dance_loop_gen.utils.csv_handler import CSVHandler
+from dance_loop_gen.utils.csv_handler import CSVHandler, CSVUpdateSession
 from dance_loop_gen.utils.request_builder import build_request_from_csv
+from dance_loop_gen.utils.genai_client import submit
 from dance_loop_gen.utils.logger import setup_logger, console
 from rich.rule import Rule
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -23,6 +27,71 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 logger = setup_logger()
 
 
+class PlanPipeline:
+    """Plans batch rows a few at a time, ahead of the rows being generated.
+    
+    At most ``window`` plans are requested but not yet taken by a row. Each
+    taken plan lets the next row's request start, so Director calls overlap
+    keyframe generation without planning the whole batch up front: a batch
+    stopped early loses at most ``window`` plans.
+    """
+    
+    def __init__(self, director: DirectorService, requests: List[str], window: int):
+        """Start planning the first ``window`` rows.
+        
+        Args:
+            director: Director service used for every plan
+            requests: Director request for each row, in row order
+            window: Plans requested ahead of the rows that use them
+        """
+        self.director = director
+        self.requests = requests
+        self._futures: List[Optional[Future]] = [None] * len(requests)
+        self._next = 0
+        self._lock = threading.Lock()
+        for _ in range(max(1, window)):
+            self._submit_next()
+    
+    def _submit_next(self) -> None:
+        """Start planning the next unplanned row, if any (caller holds the lock or is __init__)."""
+        if self._next < len(self.requests):
+            self._futures[self._next] = submit(self.director.generate_plan_async(self.requests[self._next]))
+            self._next += 1
+    
+    def result(self, index: int) -> VideoPlan:
+        """Wait for a row's plan, then start planning one more row.
+        
+        Args:
+            index: Row position in requests (0-based)
+            
+        Returns:
+            The row's plan (its planning error is raised)
+        """
+        with self._lock:
+            # A row reached before its plan was requested starts it here
+            while self._futures[index] is None:
+                self._submit_next()
+            future = self._futures[index]
+        try:
+            return future.result()
+        finally:
+            with self._lock:
+                self._submit_next()
+    
+    def cancel(self) -> None:
+        """Cancel plans that no row has taken (e.g. when the batch is interrupted)."""
+        with self._lock:
+            for future in self._futures:
+                if future is not None:
+                    future.cancel()
+    
+    def __enter__(self) -> "PlanPipeline":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.cancel()
+
+
 class BatchOrchestrator:
     """Orchestrates batch video generation from CSV files."""
     
@@ -48,10 +117,15 @@ class BatchOrchestrator:
         self.veo = veo
         self.seo_specialist = seo_specialist
         self.report_service = report_service
+        # Paths already resolved to an existing file (misses are not cached)
+        self._resolved_csv_paths: Dict[str, str] = {}
     
     def resolve_csv_path(self, csv_path: str) -> Optional[str]:
         """Resolve CSV path to absolute path.
         
+        Successful resolutions are remembered, so should_use_batch_mode() and
+        the batch run that follows only stat the candidates once.
+        
         Args:
             csv_path: Relative or absolute path to CSV file
             
@@ -61,6 +135,16 @@ class BatchOrchestrator:
         if not csv_path:
             return None
         
+        resolved = self._resolved_csv_paths.get(csv_path)
+        if resolved is None:
+            resolved = self._find_csv_path(csv_path)
+            if resolved is not None:
+                self._resolved_csv_paths[csv_path] = resolved
+        return resolved
+    
+    @staticmethod
+    def _find_csv_path(csv_path: str) -> Optional[str]:
+        """Locate a CSV file on disk (see resolve_csv_path)."""
         # If already absolute and exists
         if os.path.isabs(csv_path) and os.path.exists(csv_path):
             return csv_path
@@ -156,28 +240,73 @@ class BatchOrchestrator:
             console.print(f"[bold red]❌ Error reading CSV file:[/bold red] {e}")
             raise
         
-        # Process each row with a progress bar
-        with Progress(
+        requests = [build_request_from_csv(csv_row, base_user_request) for csv_row in pending_rows]
+        
+        # Process each row with a progress bar. "Created" flags are written to the
+        # CSV every CSV_FLUSH_EVERY completions; the session flushes the remainder
+        # when the batch ends, even on error.
+        max_workers = min(Config.BATCH_CONCURRENCY, len(pending_rows))
+        csv_updates = (
+            CSVHandler.open_for_updates(csv_path, flush_every=Config.CSV_FLUSH_EVERY)
+            if Config.CSV_AUTO_UPDATE else None
+        )
+        # Rows are planned a few ahead of generation, so Director calls overlap the
+        # previous rows' keyframes; a failed plan is reported by its own row
+        planner = PlanPipeline(
+            self.director, requests, max(Config.BATCH_CONCURRENCY, Config.PLAN_BATCH_CONCURRENCY)
+        )
+        with csv_updates or nullcontext(), planner, Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=console
+            console=console,
+            # Redraws come from the auto-refresh thread only; updates between ticks coalesce
+            refresh_per_second=2,
+            transient=True,
+            # No live bar when output is redirected (e.g. to a log file); each row
+            # already logs its own start and completion
+            disable=not console.is_terminal
         ) as progress:
             batch_task = progress.add_task("[cyan]Batch Progress", total=len(pending_rows))
             
-            for idx, csv_row in enumerate(pending_rows, start=1):
-                progress.update(batch_task, description=f"[cyan]Processing {idx}/{len(pending_rows)}: [italic]{csv_row.style}[/italic]")
+            if max_workers <= 1:
+                for idx, csv_row in enumerate(pending_rows, start=1):
+                    progress.update(batch_task, description=f"[cyan]Processing {idx}/{len(pending_rows)}: [italic]{csv_row.style}[/italic]")
+                    
+                    self._process_single_row(
+                        csv_row,
+                        idx,
+                        len(pending_rows),
+                        requests[idx - 1],
+                        planner,
+                        csv_updates,
+                        video_processor
+                    )
+                    progress.advance(batch_task)
+            else:
+                # Rows are independent and bound by API latency, so threads are enough.
+                # _process_single_row handles its own errors; one failure doesn't cancel the rest.
+                logger.info(f"Processing rows with {max_workers} concurrent workers")
+                progress.update(batch_task, description=f"[cyan]Processing {len(pending_rows)} videos ({max_workers} at a time)")
                 
-                self._process_single_row(
-                    csv_row,
-                    idx,
-                    len(pending_rows),
-                    base_user_request,
-                    csv_path,
-                    video_processor
-                )
-                progress.advance(batch_task)
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-row") as executor:
+                    futures = [
+                        executor.submit(
+                            self._process_single_row,
+                            csv_row,
+                            idx,
+                            len(pending_rows),
+                            enriched_request,
+                            planner,
+                            csv_updates,
+                            video_processor
+                        )
+                        for idx, (csv_row, enriched_request) in enumerate(zip(pending_rows, requests), start=1)
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+                        progress.advance(batch_task)
         
         console.print(Rule(style="bold green"))
         console.print(f"[bold green]🎉 Batch processing complete![/bold green]")
@@ -189,8 +318,9 @@ class BatchOrchestrator:
         csv_row: CSVRow,
         idx: int,
         total: int,
-        base_user_request: str,
-        csv_path: str,
+        enriched_request: str,
+        planner: PlanPipeline,
+        csv_updates: Optional[CSVUpdateSession],
         video_processor
     ) -> None:
         """Process a single CSV row.
@@ -199,8 +329,9 @@ class BatchOrchestrator:
             csv_row: The CSV row to process
             idx: Current index (1-based)
             total: Total number of rows
-            base_user_request: Base template for user requests
-            csv_path: Path to CSV file
+            enriched_request: Director request built from the row
+            planner: Pipeline holding the row's plan (at index idx - 1)
+            csv_updates: Open CSV update session, or None if auto-update is disabled
             video_processor: Callable that processes a single video
         """
         logger.info("=" * 60)
@@ -212,11 +343,10 @@ class BatchOrchestrator:
         console.print(f"[bold]Style:[/bold] {csv_row.style}")
         console.print(f"[bold]Music:[/bold] {csv_row.music}")
         
-        # Build enriched request from CSV
-        enriched_request = build_request_from_csv(csv_row, base_user_request)
-        
         # Process the video
         try:
+            plan = planner.result(idx - 1)
+            
             output_dir = video_processor(
                 enriched_request,
                 self.director,
@@ -225,16 +355,17 @@ class BatchOrchestrator:
                 self.seo_specialist,
                 csv_row,
                 reference_pose_index=idx - 1,  # Convert to 0-based index for cycling
-                report_service=self.report_service
+                report_service=self.report_service,
+                project_plan=plan
             )
             
             logger.info(f"✅ Video {idx}/{total} completed: {output_dir}")
             console.print(f"[bold green]✅ Video {idx}/{total} completed![/bold green]")
             
             # Mark as completed in CSV
-            if Config.CSV_AUTO_UPDATE:
-                CSVHandler.mark_row_completed(csv_path, csv_row.row_index)
-                logger.info(f"Updated CSV row {csv_row.row_index} to Created=TRUE")
+            if csv_updates is not None:
+                csv_updates.mark_completed(csv_row.row_index)
+                logger.info(f"Marked CSV row {csv_row.row_index} as Created=TRUE")
                 console.print(f"[italic gray]📝 Updated CSV: Row {csv_row.row_index} marked as complete[/italic gray]")
             
         except Exception as e:
@@ -1,27 +1,216 @@
+import asyncio
+import io
 import os
 import base64
+import binascii
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from string import ascii_uppercase
 from typing import Dict, List, Any
 from google import genai
 from google.genai import types
-from core.interfaces import ICinematographer
-from core.models import VideoPlan
-from config import Config
-from utils.prompt_loader import PromptLoader
-from utils.logger import setup_logger, save_state
+from PIL import Image
+from ..core.interfaces import ICinematographer
+from ..core.models import VideoPlan
+from ..config import Config
+from ..utils.prompt_loader import PromptLoader
+from ..utils.fs import ensure_dir
+from ..utils.genai_client import run_sync
+from ..utils.image_cache import KeyframeCache, request_key
+from ..utils.logger import setup_logger, save_state, flush_state
 
 logger = setup_logger()
 
+_VARIETY_NONE = (
+    "Keep the background and scene elements EXACTLY the same. "
+    "Only the dancers' poses should change."
+)
+_VARIETY_MINOR = (
+    "Keep the background very similar with only minor variations. "
+    "Subtle lighting shifts or tiny element changes are allowed, but the scene "
+    "should feel nearly identical."
+)
+_VARIETY_MODERATE = (
+    "Moderate background variation is allowed. You may: \n"
+    "- Shift lighting or time of day slightly\n"
+    "- Add or remove minor objects\n"
+    "- Include 1-2 people or small animals in the distant background\n"
+    "Keep the overall composition and location recognizable."
+)
+_VARIETY_SIGNIFICANT = (
+    "Significant background variation is encouraged. You may: \n"
+    "- Change time of day noticeably\n"
+    "- Alter weather conditions\n"
+    "- Add background characters or animals\n"
+    "- Transform environmental details substantially\n"
+    "Maintain the overall style and vibe."
+)
+_VARIETY_DRAMATIC = (
+    "Dramatic scene variation is desired. You may: \n"
+    "- Make major changes to setting elements\n"
+    "- Shift between different times of day dramatically\n"
+    "- Change weather significantly\n"
+    "- Add crowds, multiple animals, or busy environments\n"
+    "- Transform the scene while preserving the core style and aesthetic\n"
+    "Be creative with the environment!"
+)
+
+def _write_bytes(filepath: str, data: bytes) -> None:
+    """Write a whole blob straight to a file descriptor.
+
+    Keyframes are written in one piece, so this skips the buffered io layer
+    (and its intermediate copy) that open(..., "wb") would add.
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        if hasattr(os, "posix_fallocate") and view.nbytes:
+            # Reserve the full size up front so the blocks are allocated in one go
+            try:
+                os.posix_fallocate(fd, 0, view.nbytes)
+            except OSError:
+                pass  # Filesystem without fallocate support; plain writes still work
+        _write_all(fd, view)
+    finally:
+        os.close(fd)
+
+def _write_all(fd: int, view: memoryview) -> None:
+    """Write a buffer to a raw fd, retrying short writes."""
+    written = 0
+    while written < len(view):
+        written += os.write(fd, view[written:])
+
+# Encoded characters decoded per step; a multiple of 4 so each chunk decodes on its own
+_BASE64_CHUNK = 256 * 1024
+
+def _write_base64(filepath: str, encoded: str) -> None:
+    """Decode unwrapped base64 text into a file one chunk at a time.
+
+    Only one decoded chunk is held in memory alongside the encoded string,
+    instead of a full decoded copy of the image.
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, len(encoded), _BASE64_CHUNK):
+            _write_all(fd, memoryview(binascii.a2b_base64(encoded[start:start + _BASE64_CHUNK])))
+    finally:
+        os.close(fd)
+
+def _write_webp(filepath: str, data: Any) -> None:
+    """Transcode an image to lossless WebP and write it to filepath."""
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    with Image.open(io.BytesIO(data)) as img:
+        img.save(filepath, format="WEBP", lossless=True, method=6)
+
+# Leading bytes of the image formats the image model returns
+_IMAGE_SIGNATURES = {
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/jpeg": (b"\xff\xd8\xff",),
+}
+
+def _has_image_signature(header: bytes, mime_type: str) -> bool:
+    """Checks the leading bytes of an image against its declared MIME type.
+
+    WebP is identified by "RIFF" followed by "WEBP" at offset 8. Other MIME
+    types are not checked.
+    """
+    if mime_type == "image/webp":
+        return header[:4] == b"RIFF" and header[8:12] == b"WEBP"
+    signatures = _IMAGE_SIGNATURES.get(mime_type)
+    return signatures is None or header.startswith(signatures)
+
+# Reference poses larger than this (long edge, px) are downscaled once at load time
+_REFERENCE_POSE_MAX_EDGE = 1024
+
+
+def _downscale_reference_pose(image_bytes: bytes, mime_type: str) -> tuple[bytes, str]:
+    """Shrinks a large reference pose to a JPEG so each Keyframe A upload stays small.
+
+    Images already within _REFERENCE_POSE_MAX_EDGE, or that Pillow cannot read,
+    are returned unchanged.
+    """
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            if max(img.size) <= _REFERENCE_POSE_MAX_EDGE:
+                return image_bytes, mime_type
+            img = img.convert("RGB")
+            img.thumbnail((_REFERENCE_POSE_MAX_EDGE, _REFERENCE_POSE_MAX_EDGE), Image.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=85)
+    except Exception as e:
+        logger.warning("Could not downscale reference pose, using it as is: %s", e)
+        return image_bytes, mime_type
+    return buffer.getvalue(), "image/jpeg"
+
+# Keyframe files are written in the background so the next image request is sent
+# while the previous file is still flushing to disk. One pool serves every service
+# instance; the web server builds new services for each request.
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="keyframe-io")
+
+# Edit history is capped at [master prompt, Keyframe A, previous edit, previous keyframe, current edit]
+_MAX_EDIT_HISTORY = 5
+
+# Appended to the master prompt when a reference pose image is attached
+_REFERENCE_POSE_INSTRUCTION = (
+    "\n\nIMPORTANT: Use the attached reference image as a guide for:\n"
+    "- The FRAMING and COMPOSITION (shot type, camera angle, how much of the frame the dancers occupy)\n"
+    "- The position and pose of the dancers\n"
+    "- The body positions and spatial arrangement\n"
+    "Apply the character descriptions and setting from above while maintaining the reference image's framing and pose structure."
+)
+
+# Keyframe A sets the frame format; edits inherit it from the history
+_KEYFRAME_A_CONFIG = types.GenerateContentConfig(
+    image_config=types.ImageConfig(aspect_ratio="9:16")
+)
+
+# Variation instruction for each scene variety level, indexed 0-10
+_VARIETY_INSTRUCTIONS = (
+    (_VARIETY_NONE,)
+    + (_VARIETY_MINOR,) * 3        # 1-3
+    + (_VARIETY_MODERATE,) * 3     # 4-6
+    + (_VARIETY_SIGNIFICANT,) * 3  # 7-9
+    + (_VARIETY_DRAMATIC,)         # 10
+)
+
 class CinematographerService(ICinematographer):
     def __init__(self, client: genai.Client):
         self.client = client
         self.output_dir = Config.OUTPUT_DIR
-        os.makedirs(self.output_dir, exist_ok=True)
+        ensure_dir(self.output_dir)
         
-        # Load reference pose images
-        self.reference_poses = self._load_reference_poses()
+        # Writes queued on _IO_POOL, per output folder, so a run can wait for its own files
+        self._pending_writes: Dict[str, List[Future]] = {}
+        self._pending_writes_lock = threading.Lock()
+        
+        # Content-addressed store of previously generated keyframes (opt-in)
+        self._keyframe_cache = KeyframeCache(Config.KEYFRAME_CACHE_DIR) if Config.KEYFRAME_CACHE else None
+        
+        # Image prompt templates are read once; each keyframe only runs str.format
+        self._templates = {
+            name: PromptLoader.load(name)
+            for name in ("cinematographer_master.txt", "cinematographer_edit.txt")
+        }
+
+        logger.debug("CinematographerService initialized with output_dir: %s", self.output_dir)
 
-        logger.debug(f"CinematographerService initialized with output_dir: {self.output_dir}")
-        logger.info(f"Loaded {len(self.reference_poses)} reference pose(s)")
+    @cached_property
+    def reference_poses(self) -> List[Any]:
+        """Reference pose images, read from disk the first time they are needed."""
+        poses = [_downscale_reference_pose(*pose) for pose in self._load_reference_poses()]
+        logger.info("Loaded %d reference pose(s)", len(poses))
+        return poses
+
+    @cached_property
+    def reference_pose_parts(self) -> List[types.Part]:
+        """Reference poses wrapped once; the same Part is reused for every keyframe A that cycles onto it."""
+        return [
+            types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
+            for image_bytes, mime_type in self.reference_poses
+        ]
 
     def _load_reference_poses(self) -> List[Any]:
         """Loads reference poses from directory or fallback patterns."""
@@ -41,90 +230,96 @@ class CinematographerService(ICinematographer):
                     break
         return poses
     
+
+    def _format_template(self, filename: str, **kwargs: Any) -> str:
+        """Format a prompt template held on the service, loading it on first use."""
+        template = self._templates.get(filename)
+        if template is None:
+            template = self._templates[filename] = PromptLoader.load(filename)
+        return template.format(**kwargs)
+
     def _build_variety_instruction(self, variety: int) -> str:
         """Build scene variation instructions based on variety level (0-10)."""
-        if variety == 0:
-            return (
-                "Keep the background and scene elements EXACTLY the same. "
-                "Only the dancers' poses should change."
-            )
-        elif variety <= 3:
-            return (
-                "Keep the background very similar with only minor variations. "
-                "Subtle lighting shifts or tiny element changes are allowed, but the scene "
-                "should feel nearly identical."
-            )
-        elif variety <= 6:
-            return (
-                "Moderate background variation is allowed. You may: \n"
-                "- Shift lighting or time of day slightly\n"
-                "- Add or remove minor objects\n"
-                "- Include 1-2 people or small animals in the distant background\n"
-                "Keep the overall composition and location recognizable."
-            )
-        elif variety <= 9:
-            return (
-                "Significant background variation is encouraged. You may: \n"
-                "- Change time of day noticeably\n"
-                "- Alter weather conditions\n"
-                "- Add background characters or animals\n"
-                "- Transform environmental details substantially\n"
-                "Maintain the overall style and vibe."
-            )
-        else:  # variety == 10
-            return (
-                "Dramatic scene variation is desired. You may: \n"
-                "- Make major changes to setting elements\n"
-                "- Shift between different times of day dramatically\n"
-                "- Change weather significantly\n"
-                "- Add crowds, multiple animals, or busy environments\n"
-                "- Transform the scene while preserving the core style and aesthetic\n"
-                "Be creative with the environment!"
-            )
+        return _VARIETY_INSTRUCTIONS[max(0, min(10, variety))]
 
-    def _save_image(self, part, filename):
-        logger.info(f"Attempting to save {filename}...")
+    def _save_image(self, part, filename, output_dir: str):
+        logger.info("Attempting to save %s...", filename)
         
-        # Log available attributes on the part
-        logger.debug(f"Part attributes: {dir(part)}")
+        # Log which fields are populated on the part; dir(part) listed every
+        # attribute of the pydantic model and was formatted on every save
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Part fields set: %s", sorted(part.model_fields_set))
         
         if part.inline_data:
-            logger.debug(f"Found inline_data. MimeType: {part.inline_data.mime_type}")
+            logger.debug("Found inline_data. MimeType: %s", part.inline_data.mime_type)
             try:
                 data = part.inline_data.data
-                logger.debug(f"Data type: {type(data)}")
+                logger.debug("Data type: %s", type(data))
                 
-                if isinstance(data, bytes):
-                    image_data = data
+                # The SDK returns raw bytes; only a base64 string fails the buffer check
+                try:
+                    size = memoryview(data).nbytes
+                    header = data[:16]
+                    write_fn = _write_bytes
                     logger.debug("Data is bytes, using directly.")
-                else:
-                    # Assume string -> base64
-                    image_data = base64.b64decode(data)
-                    logger.debug("Data is string, decoded base64.")
-
-                logger.debug(f"Final data size: {len(image_data)} bytes.")
-                if len(image_data) < 1000:
-                    logger.warning("Warning: Saved image is unusually small (<1KB).")
+                except TypeError:
+                    # Decoded in chunks while writing; the size here is the decoded estimate
+                    size = len(data) * 3 // 4
+                    header = binascii.a2b_base64(data[:24])
+                    write_fn = _write_base64
+                    logger.debug("Data is string, decoding base64 while writing.")
+
+                logger.debug("Final data size: %d bytes.", size)
+                if not _has_image_signature(header, part.inline_data.mime_type):
+                    raise RuntimeError(f"Image data for {filename} does not match {part.inline_data.mime_type}")
                 
-                filepath = os.path.join(self.output_dir, filename)
-                with open(filepath, "wb") as f:
-                    f.write(image_data)
+                filepath = os.path.join(output_dir, filename)
+                if filename.endswith(".webp"):
+                    # Transcoded on the I/O pool, overlapping the next API call
+                    write_fn = _write_webp
+                self._queue_write(output_dir, write_fn, filepath, data)
                 
-                logger.info(f"Saved: {filepath}")
+                logger.info("Queued write: %s", filepath)
                 return filepath
             except Exception as e:
-                logger.error(f"Error saving {filename}: {e}", exc_info=True)
+                logger.error("Error saving %s: %s", filename, e, exc_info=True)
                 raise
         else:
-            logger.warning(f"No inline_data found for {filename}. Inspecting full part...")
-            logger.debug(f"Part content: {part}")
+            logger.warning("No inline_data found for %s. Inspecting full part...", filename)
+            logger.debug("Part content: %r", part)
             
         return None
 
-    def _generate_keyframe_a(self, plan: VideoPlan, reference_pose_index: int) -> tuple[str, Any]:
-        """Generates the master keyframe (A) and returns its path and response parts."""
+    def _queue_write(self, output_dir: str, write_fn, *args: Any) -> None:
+        """Submits a file write to the I/O pool and tracks it under output_dir."""
+        future = _IO_POOL.submit(write_fn, *args)
+        with self._pending_writes_lock:
+            self._pending_writes.setdefault(output_dir, []).append(future)
+
+    def _wait_for_writes(self, output_dir: str, raise_errors: bool = True) -> None:
+        """Blocks until every image queued for output_dir is on disk.
+        
+        Args:
+            output_dir: Directory the writes were queued for
+            raise_errors: Re-raise the first failed write after all have finished
+        """
+        with self._pending_writes_lock:
+            futures = self._pending_writes.pop(output_dir, [])
+        
+        first_error = None
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                logger.error("Error writing image in %s: %s", output_dir, error)
+                first_error = first_error or error
+        
+        if first_error is not None and raise_errors:
+            raise first_error
+
+    def _build_keyframe_a_request(self, plan: VideoPlan, reference_pose_index: int) -> tuple[str, Any]:
+        """Builds the master prompt and request contents for the master keyframe (A)."""
         logger.info("--- Generating Keyframe A (Master) ---")
-        prompt_a = PromptLoader.load_formatted(
+        prompt_a = self._format_template(
             "cinematographer_master.txt",
             setting_desc=plan.setting_desc,
             character_leader_desc=plan.character_leader_desc,
@@ -133,123 +328,242 @@ class CinematographerService(ICinematographer):
         )
 
         contents_a = prompt_a
-        if self.reference_poses:
+        pose_count = len(self.reference_pose_parts)
+        if pose_count:
             # Select reference pose based on index (cycle if needed)
-            pose_idx = reference_pose_index % len(self.reference_poses)
-            image_bytes, mime_type = self.reference_poses[pose_idx]
+            pose_idx = reference_pose_index % pose_count
 
-            logger.info(f"Using reference pose {pose_idx + 1}/{len(self.reference_poses)}")
+            logger.info("Using reference pose %d/%d", pose_idx + 1, pose_count)
 
-            reference_instruction = (
-                "\n\nIMPORTANT: Use the attached reference image as a guide for:\n"
-                "- The FRAMING and COMPOSITION (shot type, camera angle, how much of the frame the dancers occupy)\n"
-                "- The position and pose of the dancers\n"
-                "- The body positions and spatial arrangement\n"
-                "Apply the character descriptions and setting from above while maintaining the reference image's framing and pose structure."
-            )
-            prompt_a_with_ref = prompt_a + reference_instruction
+            prompt_a_with_ref = prompt_a + _REFERENCE_POSE_INSTRUCTION
 
             contents_a = [
                 prompt_a_with_ref,
-                types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
+                self.reference_pose_parts[pose_idx]
             ]
 
         save_state("cinematographer_keyframe_a_prompt", {
             "prompt": prompt_a,
-            "has_reference_pose": len(self.reference_poses) > 0,
-            "reference_pose_index": reference_pose_index if self.reference_poses else None
+            "has_reference_pose": pose_count > 0,
+            "reference_pose_index": reference_pose_index if pose_count else None
         }, logger)
 
         print("   Generating Keyframe A (Master)...")
-        if self.reference_poses:
-            pose_idx = reference_pose_index % len(self.reference_poses)
-            print(f"   📷 Using reference pose {pose_idx + 1}/{len(self.reference_poses)}")
+        if pose_count:
+            print(f"   📷 Using reference pose {pose_idx + 1}/{pose_count}")
 
-        logger.info(f"Calling Gemini API for Keyframe A (model: {Config.MODEL_NAME_IMAGE})")
+        logger.info("Calling Gemini API for Keyframe A (model: %s)", Config.MODEL_NAME_IMAGE)
+        return prompt_a, contents_a
 
-        response_a = self.client.models.generate_content(
-            model=Config.MODEL_NAME_IMAGE,
-            contents=contents_a,
-            config=types.GenerateContentConfig(
-                image_config=types.ImageConfig(aspect_ratio="9:16")
-            )
+    def _build_edit_history(self, prompt_master: str, keyframe_letter: str, pose_description: str,
+                            history: List[types.Content], previous_response_parts: Any,
+                            variety_instruction: str) -> List[types.Content]:
+        """Extends the edit history with the previous response and the next edit prompt.
+
+        With no history yet (Keyframe B, or any keyframe when fanning out), a new
+        one is started from the master prompt and previous_response_parts. Turns
+        between Keyframe A and the previous keyframe are dropped, so each request
+        carries at most two keyframe images.
+        """
+        logger.info("--- Generating Keyframe %s (via Editing) ---", keyframe_letter)
+
+        prompt_edit = self._format_template(
+            "cinematographer_edit.txt",
+            pose_description=pose_description,
+            variety_instruction=variety_instruction
         )
+        print(f"   Generating Keyframe {keyframe_letter} (via Editing)...")
+
+        if history is None:
+            # Start a fresh history that excludes the reference pose; the master
+            # prompt is the one Keyframe A was generated from
+            return [
+                types.Content(role="user", parts=[types.Part(text=prompt_master)]),
+                types.Content(role="model", parts=previous_response_parts),
+                types.Content(role="user", parts=[types.Part(text=prompt_edit)])
+            ]
+
+        history.extend([
+            types.Content(role="model", parts=previous_response_parts),
+            types.Content(role="user", parts=[types.Part(text=prompt_edit)])
+        ])
+        if len(history) > _MAX_EDIT_HISTORY:
+            # Keep the master prompt + Keyframe A and the latest edit round; older
+            # keyframe images would otherwise be re-uploaded on every call
+            del history[2:-3]
+        return history
 
-        part_a = [p for p in response_a.parts if p.inline_data][0]
-        path_a = self._save_image(part_a, "keyframe_A.png")
+    @staticmethod
+    def _edit_keyframes(plan: VideoPlan):
+        """Yields (letter, start pose) for the keyframes generated by editing (B, C, etc.)."""
+        for keyframe_letter, scene in zip(ascii_uppercase[1:], plan.scenes[1:]):
+            yield keyframe_letter, scene.start_pose_description
+
+    def _load_cached_keyframe(self, cache_key: str, keyframe_letter: str, output_dir: str):
+        """Places a cached keyframe into output_dir.
+
+        Returns:
+            (path, parts) like _agenerate_keyframe, or None on a cache miss
+        """
+        cached = self._keyframe_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        path = os.path.join(output_dir, self._keyframe_filename(keyframe_letter))
+        if path.endswith(".webp"):
+            # Cache entries hold the model's original bytes
+            self._queue_write(output_dir, _write_webp, path, cached[0])
+        else:
+            self._keyframe_cache.link(cache_key, path)
+
+        logger.info("Keyframe %s served from cache: %s", keyframe_letter, self._keyframe_cache.image_path(cache_key))
+        print(f"   ♻️  Reusing cached Keyframe {keyframe_letter}")
+        save_state(f"cinematographer_keyframe_{keyframe_letter.lower()}_complete", {
+            "path": path,
+            "status": "success",
+            "cached": True
+        }, logger)
 
-        save_state("cinematographer_keyframe_a_complete", {
-            "path": path_a,
+        # The cached response parts let later edits build on this keyframe
+        return path, cached[1]
+
+    @staticmethod
+    def _keyframe_filename(keyframe_letter: str) -> str:
+        """File name for a keyframe in the configured KEYFRAME_FORMAT."""
+        extension = "webp" if Config.KEYFRAME_FORMAT == "webp" else "png"
+        return f"keyframe_{keyframe_letter}.{extension}"
+
+    @staticmethod
+    def _first_image_part(response: Any):
+        """Returns the first part carrying inline image data, or None."""
+        return next((p for p in response.parts or () if p.inline_data), None)
+
+    def _save_keyframe(self, response: Any, keyframe_letter: str, output_dir: str, cache_key: str = None) -> str:
+        """Saves the image from a keyframe response and records its completion."""
+        part = self._first_image_part(response)
+        if part is None:
+            save_state(f"cinematographer_keyframe_{keyframe_letter.lower()}_no_image", {
+                "parts_count": len(response.parts or ()),
+                "text": response.text if response.parts else None,
+                "finish_reason": str(response.candidates[0].finish_reason) if response.candidates else None
+            }, logger)
+            raise RuntimeError(f"Gemini returned no image for Keyframe {keyframe_letter}")
+        path = self._save_image(part, self._keyframe_filename(keyframe_letter), output_dir)
+        if cache_key:
+            self._queue_write(output_dir, self._put_cached_keyframe, cache_key, part.inline_data.data, response.parts)
+
+        save_state(f"cinematographer_keyframe_{keyframe_letter.lower()}_complete", {
+            "path": path,
             "status": "success"
         }, logger)
 
-        return path_a, response_a.parts
+        return path
 
-    def _generate_sequential_keyframes(self, plan: VideoPlan, previous_response_parts: Any,
-                                     variety_instruction: str, assets: Dict[str, str]):
-        """Generates subsequent keyframes (B, C, etc.) using the edit history."""
-        keyframe_letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-        current_history = None
+    def _lookup_cached_keyframe(self, keyframe_letter: str, contents: Any, output_dir: str,
+                                config: types.GenerateContentConfig = None) -> tuple[str, Any]:
+        """Hashes a keyframe request and places a cached result into output_dir.
 
-        for i, scene in enumerate(plan.scenes[1:], start=1):
-            if i >= len(keyframe_letters):
-                break
+        Returns:
+            (cache_key, cached) where cached is (path, parts), or None on a miss
+        """
+        cache_key = request_key(Config.MODEL_NAME_IMAGE, contents, config)
+        try:
+            return cache_key, self._load_cached_keyframe(cache_key, keyframe_letter, output_dir)
+        except OSError as e:
+            # The cache is an optimization; an unreadable entry is just a miss
+            logger.warning("Keyframe cache read failed for %s, generating it: %s", keyframe_letter, e)
+            return cache_key, None
 
-            keyframe_letter = keyframe_letters[i]
-            logger.info(f"--- Generating Keyframe {keyframe_letter} (via Editing) ---")
+    def _put_cached_keyframe(self, cache_key: str, image_data: Any, parts: List[types.Part]) -> None:
+        """Stores a keyframe in the cache; I/O errors are logged and never fail the run."""
+        try:
+            self._keyframe_cache.put(cache_key, image_data, parts)
+        except OSError as e:
+            logger.warning("Could not write keyframe cache entry %s: %s", cache_key, e)
 
-            prompt_edit = PromptLoader.load_formatted(
-                "cinematographer_edit.txt",
-                pose_description=scene.start_pose_description,
-                variety_instruction=variety_instruction
+    async def _agenerate_keyframe(self, keyframe_letter: str, contents: Any, output_dir: str,
+                                  config: types.GenerateContentConfig = None) -> tuple[str, Any]:
+        """Calls the image model for one keyframe, saves it and returns its path and response parts."""
+        cache_key = None
+        if self._keyframe_cache:
+            # Hashing the attached images and reading cache files stay off the event loop
+            cache_key, cached = await asyncio.to_thread(
+                self._lookup_cached_keyframe, keyframe_letter, contents, output_dir, config
             )
-            print(f"   Generating Keyframe {keyframe_letter} (via Editing)...")
-
-            if keyframe_letter == 'B':
-                # Reset history to exclude reference pose for Keyframe B
-                prompt_base = PromptLoader.load_formatted(
-                    "cinematographer_master.txt",
-                    setting_desc=plan.setting_desc,
-                    character_leader_desc=plan.character_leader_desc,
-                    character_follower_desc=plan.character_follower_desc,
-                    action=plan.scenes[0].start_pose_description
-                )
-                current_history = [
-                    types.Content(role="user", parts=[types.Part(text=prompt_base)]),
-                    types.Content(role="model", parts=previous_response_parts),
-                    types.Content(role="user", parts=[types.Part(text=prompt_edit)])
-                ]
-            else:
-                current_history.extend([
-                    types.Content(role="model", parts=previous_response_parts),
-                    types.Content(role="user", parts=[types.Part(text=prompt_edit)])
-                ])
-
-            response = self.client.models.generate_content(
-                model=Config.MODEL_NAME_IMAGE,
-                contents=list(current_history)
+            if cached is not None:
+                return cached
+
+        response = await self.client.aio.models.generate_content(
+            model=Config.MODEL_NAME_IMAGE,
+            contents=contents,
+            config=config
+        )
+        return self._save_keyframe(response, keyframe_letter, output_dir, cache_key), response.parts
+
+    async def _agenerate_keyframe_a(self, plan: VideoPlan, reference_pose_index: int, output_dir: str) -> tuple[str, Any, str]:
+        """Generates the master keyframe (A) and returns its path, response parts and prompt."""
+        # Reference poses are read and downscaled on first use; do that on a worker thread
+        await asyncio.to_thread(getattr, self, "reference_pose_parts")
+        prompt_a, contents_a = self._build_keyframe_a_request(plan, reference_pose_index)
+        path_a, parts_a = await self._agenerate_keyframe('A', contents_a, output_dir, _KEYFRAME_A_CONFIG)
+        return path_a, parts_a, prompt_a
+
+    async def _agenerate_sequential_keyframes(self, plan: VideoPlan, prompt_master: str, previous_response_parts: Any,
+                                              variety_instruction: str, assets: Dict[str, str], output_dir: str):
+        """Generates subsequent keyframes (B, C, etc.) using the edit history.
+
+        One history list is extended in place for the whole chain. The SDK builds
+        its own request from it, so it is passed directly rather than copied.
+        Each edit depends on the previous response, so keyframes within a plan
+        are awaited in order; other plans' calls run in the meantime.
+        """
+        current_history = None
+
+        for keyframe_letter, pose_description in self._edit_keyframes(plan):
+            current_history = self._build_edit_history(
+                prompt_master, keyframe_letter, pose_description, current_history, previous_response_parts, variety_instruction
             )
 
-            part = [p for p in response.parts if p.inline_data][0]
-            path = self._save_image(part, f"keyframe_{keyframe_letter}.png")
-            assets[keyframe_letter] = path
+            assets[keyframe_letter], previous_response_parts = await self._agenerate_keyframe(
+                keyframe_letter, current_history, output_dir
+            )
 
-            save_state(f"cinematographer_keyframe_{keyframe_letter.lower()}_complete", {
-                "path": path,
-                "status": "success"
-            }, logger)
+    def _fanout_edit_histories(self, plan: VideoPlan, prompt_master: str, parts_a: Any,
+                               variety_instruction: str) -> List[tuple[str, List[types.Content]]]:
+        """Builds an independent [master, Keyframe A, edit] history for each edited keyframe."""
+        return [
+            (keyframe_letter, self._build_edit_history(
+                prompt_master, keyframe_letter, pose_description, None, parts_a, variety_instruction
+            ))
+            for keyframe_letter, pose_description in self._edit_keyframes(plan)
+        ]
 
-            previous_response_parts = response.parts
+    async def _agenerate_fanout_keyframes(self, plan: VideoPlan, prompt_master: str, parts_a: Any,
+                                          variety_instruction: str, assets: Dict[str, str], output_dir: str):
+        """Generates subsequent keyframes concurrently, each edited from Keyframe A alone.
 
-    def generate_assets(self, plan: VideoPlan, output_dir: str = None, scene_variety: int = None, reference_pose_index: int = 0) -> Dict[str, str]:
+        Unlike the sequential chain, Keyframe C does not see B, D does not see C,
+        and so on; every edit is conditioned on the master prompt and Keyframe A,
+        exactly like Keyframe B already is.
+        """
+        jobs = self._fanout_edit_histories(plan, prompt_master, parts_a, variety_instruction)
+        results = await asyncio.gather(*(
+            self._agenerate_keyframe(keyframe_letter, history, output_dir)
+            for keyframe_letter, history in jobs
+        ))
+        for (keyframe_letter, _), (path, _) in zip(jobs, results):
+            assets[keyframe_letter] = path
+
+    def _start_assets(self, plan: VideoPlan, output_dir: str, scene_variety: int) -> tuple[str, str]:
+        """Resolves the target directory and variety instruction for a generation run."""
         logger.info("=" * 40)
         logger.info("Cinematographer: Starting asset generation")
         logger.info("=" * 40)
         
+        # Passed down explicitly rather than swapped onto self, so concurrent
+        # batch rows sharing this service never write into each other's folders
         target_dir = output_dir if output_dir else self.output_dir
-        os.makedirs(target_dir, exist_ok=True)
-        original_output_dir = self.output_dir
-        self.output_dir = target_dir
+        ensure_dir(target_dir)
         
         effective_variety = scene_variety if scene_variety is not None else Config.SCENE_VARIETY
         variety_instruction = self._build_variety_instruction(effective_variety)
@@ -261,35 +575,94 @@ class CinematographerService(ICinematographer):
             "scene_variety": effective_variety
         }, logger)
         
+        return target_dir, variety_instruction
+
+    def _finish_assets(self, assets: Dict[str, str]) -> Dict[str, str]:
+        """Logs and records a successful generation run."""
+        logger.info("=" * 40)
+        logger.info("Cinematographer: All keyframes generated successfully")
+        logger.info("Assets: %s", assets)
+        logger.info("=" * 40)
+        
+        save_state("cinematographer_complete", {
+            "assets": assets,
+            "status": "success"
+        }, logger)
+
+        return assets
+
+    def _record_assets_error(self, e: Exception) -> None:
+        """Logs and records a failed generation run."""
+        logger.error("Error generating assets: %s", e, exc_info=True)
+        save_state("cinematographer_error", {
+            "error_type": type(e).__name__,
+            "error_message": str(e)
+        }, logger)
+        # Failures are flushed right away; successful runs are flushed by the caller
+        flush_state()
+
+    def generate_assets(self, plan: VideoPlan, output_dir: str = None, scene_variety: int = None, reference_pose_index: int = 0) -> Dict[str, str]:
+        """Blocking wrapper around agenerate_assets.
+
+        The coroutine runs on the shared client loop (see run_sync), so this is
+        safe to call from batch worker threads and from inside the web server's
+        event loop.
+        """
+        return run_sync(self.agenerate_assets(plan, output_dir, scene_variety, reference_pose_index))
+
+    async def agenerate_assets(self, plan: VideoPlan, output_dir: str = None, scene_variety: int = None, reference_pose_index: int = 0) -> Dict[str, str]:
+        """Generates the keyframes for a plan using the client's aio surface.
+
+        Yields to the event loop while each image request is in flight, so
+        several plans can be generated concurrently with asyncio.gather.
+        """
+        target_dir, variety_instruction = self._start_assets(plan, output_dir, scene_variety)
+        
         try:
             assets = {}
             
             # 1. Generate Keyframe A
-            path_a, parts_a = self._generate_keyframe_a(plan, reference_pose_index)
+            path_a, parts_a, prompt_a = await self._agenerate_keyframe_a(plan, reference_pose_index, target_dir)
             assets['A'] = path_a
             
             # 2. Generate subsequent keyframes
-            self._generate_sequential_keyframes(plan, parts_a, variety_instruction, assets)
-
-            logger.info("=" * 40)
-            logger.info("Cinematographer: All keyframes generated successfully")
-            logger.info(f"Assets: {assets}")
-            logger.info("=" * 40)
-            
-            save_state("cinematographer_complete", {
-                "assets": assets,
-                "status": "success"
-            }, logger)
+            if Config.PARALLEL_KEYFRAMES:
+                await self._agenerate_fanout_keyframes(plan, prompt_a, parts_a, variety_instruction, assets, target_dir)
+            else:
+                await self._agenerate_sequential_keyframes(plan, prompt_a, parts_a, variety_instruction, assets, target_dir)
 
-            return assets
+            await asyncio.to_thread(self._wait_for_writes, target_dir)
+            return self._finish_assets(assets)
             
         except Exception as e:
-            logger.error(f"Error generating assets: {e}", exc_info=True)
-            save_state("cinematographer_error", {
-                "error_type": type(e).__name__,
-                "error_message": str(e)
-            }, logger)
+            await asyncio.to_thread(self._wait_for_writes, target_dir, False)
+            self._record_assets_error(e)
             raise
-            
-        finally:
-            self.output_dir = original_output_dir
+
+    async def agenerate_assets_batch(self, plan: VideoPlan, pose_indices: List[int], output_dir: str = None,
+                                     scene_variety: int = None) -> List[Dict[str, str]]:
+        """Generates one keyframe set per reference pose concurrently.
+
+        Each pose variant is written to its own ``pose_<n>`` folder under
+        output_dir. At most Config.POSE_BATCH_CONCURRENCY variants are in flight
+        at once.
+
+        Args:
+            plan: Video plan shared by every variant
+            pose_indices: Reference pose index for each variant (cycled like generate_assets)
+            output_dir: Parent folder for the variant folders (default: the service output_dir)
+            scene_variety: Optional variety override applied to every variant
+
+        Returns:
+            Asset maps in the same order as pose_indices
+        """
+        base_dir = output_dir if output_dir else self.output_dir
+        semaphore = asyncio.Semaphore(Config.POSE_BATCH_CONCURRENCY)
+
+        async def generate_variant(pose_index: int) -> Dict[str, str]:
+            async with semaphore:
+                return await self.agenerate_assets(
+                    plan, os.path.join(base_dir, f"pose_{pose_index + 1}"), scene_variety, pose_index
+                )
+
+        return list(await asyncio.gather(*(generate_variant(i) for i in pose_indices)))
@@ -1,17 +1,23 @@
-from typing import Dict, Any
+import asyncio
+import hashlib
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Union
 from google import genai
 from google.genai import types
 from ..core.interfaces import IDirector
-from ..core.models import VideoPlan
+from ..core.models import VideoPlan, VIDEO_PLAN_JSON_SCHEMA
 from ..config import Config
 from ..utils.prompt_loader import PromptLoader
 from ..utils.logger import setup_logger, save_state
+from ..utils.plan_cache import PlanCache
 
 logger = setup_logger()
 
 class DirectorService(IDirector):
     def __init__(self, client: genai.Client):
         self.client = client
+        # Exact-match cache of earlier plans (opt-in)
+        self._plan_cache = PlanCache(Config.PLAN_CACHE_DIR) if Config.PLAN_CACHE else None
         
         # Load optional outfit prompts
         self.leader_outfit = PromptLoader.load_optional("leader_outfit.txt")
@@ -31,10 +37,10 @@ class DirectorService(IDirector):
             setting_instructions=setting_instructions
         )
         
-        logger.debug(f"DirectorService initialized with system instruction ({len(self.system_instruction)} chars)")
-        logger.debug(f"Leader outfit: {'defined' if self.leader_outfit else 'AI decides'}")
-        logger.debug(f"Follower outfit: {'defined' if self.follower_outfit else 'AI decides'}")
-        logger.debug(f"Setting: {'defined' if self.setting else 'AI decides'}")
+        logger.debug("DirectorService initialized with system instruction (%d chars)", len(self.system_instruction))
+        logger.debug("Leader outfit: %s", "defined" if self.leader_outfit else "AI decides")
+        logger.debug("Follower outfit: %s", "defined" if self.follower_outfit else "AI decides")
+        logger.debug("Setting: %s", "defined" if self.setting else "AI decides")
 
     def _build_outfit_instructions(self) -> str:
         """Build dynamic outfit instructions based on which files are defined."""
@@ -69,7 +75,7 @@ class DirectorService(IDirector):
         """Builds the configuration dictionary for the Gemini API call."""
         config = {
             "response_mime_type": "application/json",
-            "response_json_schema": VideoPlan.model_json_schema(),
+            "response_json_schema": VIDEO_PLAN_JSON_SCHEMA,
         }
 
         # Add thinking config only for supported models (Gemini 3+)
@@ -79,12 +85,22 @@ class DirectorService(IDirector):
             config["temperature"] = 1.0  # Default required for Gemini 3 reasoning
             config["system_instruction"] = self.system_instruction
         else:
-            logger.info(f"Model {Config.MODEL_NAME_TEXT}: Thinking Mode not available")
+            logger.info("Model %s: Thinking Mode not available", Config.MODEL_NAME_TEXT)
             # For Gemini 2.5 Flash with v1beta, system_instruction should work in config
             config["system_instruction"] = self.system_instruction
 
         return config
 
+    @cached_property
+    def _generation_config_args(self) -> Dict[str, Any]:
+        """Generation config arguments, built once per service instance."""
+        return self._build_generation_config()
+
+    @cached_property
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """Validated request config reused for every plan this service generates."""
+        return types.GenerateContentConfig(**self._generation_config_args)
+
     def _log_and_save_config(self, config_args: Dict[str, Any], user_input_len: int):
         """Logs and saves the generation configuration."""
         config_summary = {
@@ -94,7 +110,7 @@ class DirectorService(IDirector):
             "temperature": config_args.get("temperature"),
             "has_system_instruction": "system_instruction" in config_args,
         }
-        logger.info(f"Final config summary: {config_summary}")
+        logger.info("Final config summary: %s", config_summary)
         
         save_state("director_config", {
             "model": Config.MODEL_NAME_TEXT,
@@ -116,8 +132,8 @@ class DirectorService(IDirector):
         logger.info("Parsing response JSON into VideoPlan...")
         plan = VideoPlan.model_validate_json(response_text)
 
-        logger.info(f"Plan parsed successfully: {plan.title}")
-        logger.debug(f"Plan details - scenes: {len(plan.scenes)}, tags: {plan.backend_tags}")
+        logger.info("Plan parsed successfully: %s", plan.title)
+        logger.debug("Plan details - scenes: %d, tags: %s", len(plan.scenes), plan.backend_tags)
 
         # Save parsed plan
         save_state("director_plan_parsed", {
@@ -133,45 +149,131 @@ class DirectorService(IDirector):
 
         return plan
 
-    def generate_plan(self, user_input: str) -> VideoPlan:
+    @cached_property
+    def system_instruction_digest(self) -> str:
+        """Hash of the system instruction, computed once since it is fixed per service."""
+        return hashlib.blake2b(self.system_instruction.encode(), digest_size=16).hexdigest()
+
+    def _plan_cache_key(self, user_input: str) -> str:
+        return PlanCache.request_key(Config.MODEL_NAME_TEXT, self.system_instruction_digest, user_input)
+
+    def _cached_plan(self, user_input: str):
+        """Returns the cached plan for user_input, or None when caching is off or it misses."""
+        if self._plan_cache is None:
+            return None
+        plan = self._plan_cache.get(self._plan_cache_key(user_input))
+        if plan is not None:
+            logger.info("Plan served from cache: %s", plan.title)
+            save_state("director_plan_cached", {
+                "title": plan.title,
+                "scenes_count": len(plan.scenes)
+            }, logger)
+            print(f"♻️  Reusing cached plan: {plan.title}")
+        return plan
+
+    def _prepare_plan_request(self, user_input: str) -> types.GenerateContentConfig:
+        """Logs the start of a plan request and returns the config to send."""
         print("🎬 Director is thinking (High Reasoning Mode)...")
 
-        logger.info(f"generate_plan called with input length: {len(user_input)} chars")
-        logger.info(f"Using model: {Config.MODEL_NAME_TEXT}")
+        logger.info("generate_plan called with input length: %d chars", len(user_input))
+        logger.info("Using model: %s", Config.MODEL_NAME_TEXT)
+
+        # Cached after the first plan; the inputs never change per instance
+        self._log_and_save_config(self._generation_config_args, len(user_input))
+        logger.info("Calling Gemini API for plan generation...")
+        return self._generation_config
 
-        # 1. Build Config
-        gen_config_args = self._build_generation_config()
-        self._log_and_save_config(gen_config_args, len(user_input))
+    def _finish_plan_request(self, user_input: str, response_text: str) -> VideoPlan:
+        """Parses a successful plan response and caches it when enabled."""
+        logger.info("API response received successfully")
+        plan = self._parse_and_save_plan(response_text)
+        if self._plan_cache is not None:
+            try:
+                self._plan_cache.put(self._plan_cache_key(user_input), plan)
+            except OSError as e:
+                # The plan is already generated; a cache that can't be written only costs reuse
+                logger.warning("Could not cache plan %r: %s", plan.title, e)
+        print(f"✅ Plan Generated: {plan.title}")
+        return plan
 
-        config = types.GenerateContentConfig(**gen_config_args)
+    def _record_plan_error(self, e: Exception) -> None:
+        """Logs and records a failed plan request."""
+        logger.error("Error generating plan: %s", e, exc_info=True)
+        
+        # Save error state
+        save_state("director_error", {
+            "error_type": type(e).__name__,
+            "error_message": str(e),
+            "model": Config.MODEL_NAME_TEXT,
+            "api_version": Config.GEMINI_VERSION
+        }, logger)
+        
+        print(f"❌ Error generating plan: {e}")
+
+    def generate_plan(self, user_input: str) -> VideoPlan:
+        cached = self._cached_plan(user_input)
+        if cached is not None:
+            return cached
+
+        config = self._prepare_plan_request(user_input)
         
         try:
-            logger.info("Calling Gemini API for plan generation...")
-            
             response = self.client.models.generate_content(
                 model=Config.MODEL_NAME_TEXT,
                 contents=user_input, 
                 config=config,
             )
-            
-            logger.info("API response received successfully")
-            
-            # 2. Parse and Save Plan
-            plan = self._parse_and_save_plan(response.text)
-            
-            print(f"✅ Plan Generated: {plan.title}")
-            return plan
+            return self._finish_plan_request(user_input, response.text)
 
         except Exception as e:
-            logger.error(f"Error generating plan: {e}", exc_info=True)
-            
-            # Save error state
-            save_state("director_error", {
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "model": Config.MODEL_NAME_TEXT,
-                "api_version": Config.GEMINI_VERSION
-            }, logger)
-            
-            print(f"❌ Error generating plan: {e}")
+            self._record_plan_error(e)
             raise
+
+    async def generate_plan_async(self, user_input: str) -> VideoPlan:
+        """Async variant of generate_plan built on client.aio.
+
+        Produces the same plan and state records as generate_plan, but yields
+        to the event loop while the request is in flight.
+        """
+        # Plan cache reads and writes are file I/O; keep them off the event loop
+        cached = await asyncio.to_thread(self._cached_plan, user_input)
+        if cached is not None:
+            return cached
+
+        config = self._prepare_plan_request(user_input)
+        
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=Config.MODEL_NAME_TEXT,
+                contents=user_input, 
+                config=config,
+            )
+            return await asyncio.to_thread(self._finish_plan_request, user_input, response.text)
+
+        except Exception as e:
+            self._record_plan_error(e)
+            raise
+
+    async def generate_plans_batch(self, user_inputs: List[str], max_concurrency: Optional[int] = None,
+                                   return_exceptions: bool = False) -> List[Union[VideoPlan, BaseException]]:
+        """Generates a plan for each input concurrently.
+
+        All requests share the service's client, system instruction and
+        generation config.
+
+        Args:
+            user_inputs: Director requests, one per plan
+            max_concurrency: Requests in flight at once (default: Config.PLAN_BATCH_CONCURRENCY)
+            return_exceptions: Return a failed request's exception in its slot
+                instead of raising it (as with asyncio.gather)
+
+        Returns:
+            Plans in the same order as user_inputs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or Config.PLAN_BATCH_CONCURRENCY)
+
+        async def plan_one(user_input: str) -> VideoPlan:
+            async with semaphore:
+                return await self.generate_plan_async(user_input)
+
+        return list(await asyncio.gather(*(plan_one(i) for i in user_inputs), return_exceptions=return_exceptions))
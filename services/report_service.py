@@ -1,9 +1,12 @@
+import io
 import os
-from typing import List, Tuple, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from openpyxl import Workbook
 from openpyxl.drawing.image import Image as XLImage
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.worksheet.worksheet import Worksheet
+from PIL import Image as PILImage
 from dance_loop_gen.core.report_models import ReportData, ReportRow
 from dance_loop_gen.utils.logger import setup_logger
 
@@ -16,12 +19,21 @@ class ReportService:
     HEADER_ROW = 4
     ROW_HEIGHT = 130
     TARGET_IMG_HEIGHT = 160
+    # Embedded keyframes are shrunk to twice the display height so they stay sharp when zoomed
+    THUMBNAIL_HEIGHT = 2 * TARGET_IMG_HEIGHT
+    THUMBNAIL_WORKERS = 4
 
     # Styles
     _THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
                           top=Side(style='thin'), bottom=Side(style='thin'))
     _CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
     _WRAP_ALIGN = Alignment(wrap_text=True, vertical="center")
+    _TITLE_FONT = Font(size=14, bold=True, color="FFFFFF")
+    _TITLE_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+    _METADATA_FONT = Font(italic=True, color="555555")
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _HEADER_FILL = PatternFill(start_color="36454F", end_color="36454F", fill_type="solid")
+    _SCENE_FONT = Font(bold=True, size=12)
 
     def generate_report(self, data: ReportData, output_path: str) -> str:
         """Generates an Excel report from ReportData."""
@@ -43,15 +55,15 @@ class ReportService:
         ws.merge_cells('A1:G1')
         cell = ws['A1']
         cell.value = f"VIDEO PLAN: {title.upper()}"
-        cell.font = Font(size=14, bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+        cell.font = self._TITLE_FONT
+        cell.fill = self._TITLE_FILL
         cell.alignment = self._CENTER_ALIGN
 
     def _write_metadata(self, ws: Worksheet, data: ReportData) -> None:
         ws.merge_cells('A2:G2')
         cell = ws['A2']
         cell.value = f"Run ID: {data.run_id} | Generated: {data.generated_at}"
-        cell.font = Font(italic=True, color="555555")
+        cell.font = self._METADATA_FONT
         cell.alignment = self._CENTER_ALIGN
 
     def _setup_table_headers(self, ws: Worksheet) -> None:
@@ -60,33 +72,38 @@ class ReportService:
             ("Audio", 25), ("Start Pose", 25), ("End Pose", 25), ("Notes", 20)
         ]
 
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="36454F", end_color="36454F", fill_type="solid")
-
         for col_num, (text, width) in enumerate(headers, 1):
             cell = ws.cell(row=self.HEADER_ROW, column=col_num, value=text)
-            cell.font = header_font
-            cell.fill = header_fill
+            cell.font = self._HEADER_FONT
+            cell.fill = self._HEADER_FILL
             cell.alignment = self._CENTER_ALIGN
             cell.border = self._THIN_BORDER
             ws.column_dimensions[chr(64 + col_num)].width = width
 
     def _write_data_rows(self, ws: Worksheet, rows: List[ReportRow]) -> None:
-        for i, row_data in enumerate(rows, start=self.HEADER_ROW + 1):
-            ws.row_dimensions[i].height = self.ROW_HEIGHT
-            self._write_single_row(ws, i, row_data)
-
-    def _write_single_row(self, ws: Worksheet, row_idx: int, data: ReportRow) -> None:
+        # Keyframes are decoded and shrunk on worker threads; openpyxl cell writes stay on this one
+        with ThreadPoolExecutor(max_workers=self.THUMBNAIL_WORKERS) as pool:
+            thumbnails = [
+                pool.submit(self._thumbnail, row.keyframe_path)
+                if row.keyframe_path and os.path.exists(row.keyframe_path) else None
+                for row in rows
+            ]
+            for i, (row_data, thumbnail) in enumerate(zip(rows, thumbnails), start=self.HEADER_ROW + 1):
+                ws.row_dimensions[i].height = self.ROW_HEIGHT
+                self._write_single_row(ws, i, row_data, thumbnail)
+
+    def _write_single_row(self, ws: Worksheet, row_idx: int, data: ReportRow,
+                          thumbnail: Optional[Future]) -> None:
         # Scene Number
         c1 = ws.cell(row=row_idx, column=1, value=data.scene_number)
         c1.alignment = self._CENTER_ALIGN
-        c1.font = Font(bold=True, size=12)
+        c1.font = self._SCENE_FONT
         c1.border = self._THIN_BORDER
 
         # Image
         c2 = ws.cell(row=row_idx, column=2)
         c2.border = self._THIN_BORDER
-        self._insert_image(ws, row_idx, data.keyframe_path, c2)
+        self._insert_image(ws, row_idx, data.keyframe_path, thumbnail, c2)
 
         # Text Columns (3-7)
         values = [data.action_description, data.audio_prompt,
@@ -97,14 +114,30 @@ class ReportService:
             cell.alignment = self._WRAP_ALIGN
             cell.border = self._THIN_BORDER
 
-    def _insert_image(self, ws: Worksheet, row_idx: int, path: str, cell) -> None:
-        if not path or not os.path.exists(path):
+    @classmethod
+    def _thumbnail(cls, path: str) -> io.BytesIO:
+        """Shrink a keyframe to THUMBNAIL_HEIGHT and encode it as an in-memory PNG.
+
+        Full-size keyframes are several megabytes each; the report only shows
+        them TARGET_IMG_HEIGHT pixels tall. PNG output also covers WebP
+        keyframes, which Excel cannot embed.
+        """
+        buffer = io.BytesIO()
+        with PILImage.open(path) as source:
+            source.thumbnail((4 * cls.THUMBNAIL_HEIGHT, cls.THUMBNAIL_HEIGHT), PILImage.LANCZOS)
+            source.save(buffer, format="PNG")
+        buffer.seek(0)
+        return buffer
+
+    def _insert_image(self, ws: Worksheet, row_idx: int, path: str,
+                      thumbnail: Optional[Future], cell) -> None:
+        if thumbnail is None:
             cell.value = "[No Image]"
             cell.alignment = self._CENTER_ALIGN
             return
 
         try:
-            img = XLImage(path)
+            img = XLImage(thumbnail.result())
             scale = self.TARGET_IMG_HEIGHT / img.height
             img.height = self.TARGET_IMG_HEIGHT
             img.width = int(img.width * scale)
@@ -1,6 +1,5 @@
 import csv
 import io
-import json
 import os
 from typing import Tuple
 
@@ -8,9 +7,11 @@ from google import genai
 from google.genai import types
 
 from ..config import Config
-from ..core.models import VideoPlan, MetadataAlternatives, MetadataConfig
+from ..core.models import VideoPlan, MetadataAlternatives, MetadataConfig, METADATA_ALTERNATIVES_JSON_SCHEMA
 from ..utils.prompt_loader import PromptLoader
 from ..utils.logger import setup_logger, save_state
+from ..utils.json_io import write_json
+from ..utils.fs import ensure_dir
 
 logger = setup_logger()
 
@@ -138,7 +139,7 @@ Analyze this data to understand what works for this audience and competitors.
         # Build configuration
         gen_config_args = {
             "response_mime_type": "application/json",
-            "response_json_schema": MetadataAlternatives.model_json_schema(),
+            "response_json_schema": METADATA_ALTERNATIVES_JSON_SCHEMA,
             "system_instruction": system_instruction,
         }
         
@@ -187,9 +188,7 @@ Generate alternatives that will connect deeply with the target audience.
             save_state("seo_specialist_response", {
                 "recommended": alternatives.recommended,
                 "reasoning": alternatives.reasoning,
-                "option_1_title": alternatives.option_1.title,
-                "option_2_title": alternatives.option_2.title,
-                "option_3_title": alternatives.option_3.title,
+                "option_titles": [option.title for option in alternatives.options],
             }, logger)
             
             print(f"✅ Generated 3 metadata alternatives (Recommended: Option {alternatives.recommended})")
@@ -205,14 +204,11 @@ Generate alternatives that will connect deeply with the target audience.
 
     def save_metadata(self, alternatives: MetadataAlternatives, output_dir: str) -> Tuple[str, str]:
         """Save metadata as both JSON and CSV."""
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
         # Save JSON
         json_path = os.path.join(output_dir, "metadata_options.json")
-        json_data = alternatives.model_dump()
-        
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        write_json(json_path, alternatives)
         
         logger.info(f"Saved metadata JSON to {json_path}")
         
@@ -223,7 +219,7 @@ Generate alternatives that will connect deeply with the target audience.
             writer = csv.writer(f)
             writer.writerow(['Option', 'Title', 'Description', 'Tags', 'Emotional Hook', 'Text Hook', 'Text Overlay', 'Recommended'])
             
-            for i, option in enumerate([alternatives.option_1, alternatives.option_2, alternatives.option_3], 1):
+            for i, option in enumerate(alternatives.options, 1):
                 recommended_mark = '✓' if i == alternatives.recommended else ''
                 writer.writerow([
                     i,
@@ -1,20 +1,21 @@
-import json
 import os
 from typing import Dict
 from ..core.interfaces import IVeoInstruction
 from ..core.models import VideoPlan
 from ..config import Config
+from ..utils.json_io import write_json
+from ..utils.fs import ensure_dir
 
 class VeoService(IVeoInstruction):
     def __init__(self):
         self.output_dir = Config.OUTPUT_DIR
-        os.makedirs(self.output_dir, exist_ok=True)
+        ensure_dir(self.output_dir)
 
     def generate_instructions(self, plan: VideoPlan, asset_map: Dict[str, str], output_dir: str = None) -> None:
         print("📹 Generating Veo instructions...")
         
         target_dir = output_dir if output_dir else self.output_dir
-        os.makedirs(target_dir, exist_ok=True) # Ensure directory exists
+        ensure_dir(target_dir)
         
         veo_tasks = [
             {
@@ -48,8 +49,7 @@ class VeoService(IVeoInstruction):
         ]
         
         output_path = os.path.join(target_dir, "veo_instructions.json")
-        with open(output_path, "w") as f:
-            json.dump(veo_tasks, f, indent=2)
+        write_json(output_path, veo_tasks)
             
         print(f"✅ Instructions saved to {output_path}")
 
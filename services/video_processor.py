@@ -7,15 +7,16 @@ following SOLID principles by separating processing logic from orchestration.
 import os
 import re
 from datetime import datetime
+from string import ascii_uppercase
 from typing import Optional, TYPE_CHECKING
 from dance_loop_gen.config import Config
-from dance_loop_gen.core.models import CSVRow
+from dance_loop_gen.core.models import CSVRow, VideoPlan
 from dance_loop_gen.core.report_models import ReportData, ReportRow
 from dance_loop_gen.services.director import DirectorService
 from dance_loop_gen.services.cinematographer import CinematographerService
 from dance_loop_gen.services.veo import VeoService
 from dance_loop_gen.services.seo_specialist import SEOSpecialistService
-from dance_loop_gen.utils.logger import setup_logger, save_state
+from dance_loop_gen.utils.logger import setup_logger, save_state, flush_state
 
 if TYPE_CHECKING:
     from dance_loop_gen.services.report_service import ReportService
@@ -35,7 +36,8 @@ class VideoProcessor:
         seo_specialist: SEOSpecialistService,
         csv_row: Optional[CSVRow] = None,
         reference_pose_index: int = 0,
-        report_service: Optional['ReportService'] = None
+        report_service: Optional['ReportService'] = None,
+        project_plan: Optional[VideoPlan] = None
     ) -> str:
         """Process a single video generation from start to finish.
         
@@ -48,6 +50,8 @@ class VideoProcessor:
             csv_row: Optional CSV row data (for batch processing)
             reference_pose_index: Index for selecting reference pose (for batch iteration)
             report_service: Optional ReportService for Excel generation
+            project_plan: Plan generated ahead of time (batch mode); the Director
+                is called with user_request when omitted
             
         Returns:
             Path to the output directory
@@ -56,8 +60,9 @@ class VideoProcessor:
             Exception if video generation fails
         """
         # 1. Generate Plan
-        logger.info("Generating video plan via Director...")
-        project_plan = director.generate_plan(user_request)
+        if project_plan is None:
+            logger.info("Generating video plan via Director...")
+            project_plan = director.generate_plan(user_request)
         logger.info(f"Plan generated successfully: {project_plan.title}")
         logger.debug(f"Plan scenes: {len(project_plan.scenes)}")
         
@@ -116,10 +121,9 @@ class VideoProcessor:
                 # The plan.scenes is a list.
 
                 rows = []
-                keyframe_letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
 
                 for i, scene in enumerate(project_plan.scenes):
-                    letter = keyframe_letters[i] if i < len(keyframe_letters) else "?"
+                    letter = ascii_uppercase[i] if i < len(ascii_uppercase) else "?"
                     keyframe_path = keyframe_assets.get(letter)
 
                     rows.append(ReportRow(
@@ -154,6 +158,8 @@ class VideoProcessor:
             "assets": keyframe_assets,
             "plan_title": project_plan.title
         }, logger)
+        # One flush per video: the step records above were only queued
+        flush_state()
         
         return run_output_dir
     
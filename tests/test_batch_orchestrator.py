@@ -0,0 +1,112 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from dance_loop_gen.config import Config
+from dance_loop_gen.core.models import VideoPlan
+from dance_loop_gen.services.batch_orchestrator import BatchOrchestrator
+
+HEADER = "Created,Style,Title (Spanish),Improve Title English,Duration,Music,Description,Keywords/Tags\n"
+STYLES = ["Salsa", "Tango", "Bolero", "Bachata", "Cumbia", "Merengue"]
+
+
+def _plan(title):
+    return VideoPlan(
+        title=title,
+        description="desc",
+        backend_tags=(),
+        character_leader_desc="leader",
+        character_follower_desc="follower",
+        setting_desc="studio",
+        scenes=[],
+    )
+
+
+class _FakeDirector:
+    """Plans each request after a short delay; Tango requests fail."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_plan_async(self, user_input):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if "Tango" in user_input:
+                raise ValueError("planning failed")
+            return _plan(next(style for style in STYLES if style in user_input))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestBatchOrchestratorPlans(unittest.TestCase):
+    def setUp(self):
+        fd, self.csv_path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(HEADER + "".join(f"FALSE,{style},t,t,18s,m,d,k\n" for style in STYLES))
+        self.patches = [
+            mock.patch.object(Config, "SAVE_STATE", False),
+            mock.patch.object(Config, "CSV_CREATE_BACKUP", False),
+            mock.patch.object(Config, "CSV_AUTO_UPDATE", True),
+            mock.patch.object(Config, "CSV_FLUSH_EVERY", 1),
+            mock.patch.object(Config, "PLAN_BATCH_CONCURRENCY", 2),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.director = _FakeDirector()
+        self.orchestrator = BatchOrchestrator(self.director, None, None, None)
+        self.seen = []
+
+    def tearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+        os.remove(self.csv_path)
+
+    def _video_processor(self, request, *args, project_plan=None, **kwargs):
+        self.assertIn(project_plan.title, request)
+        self.seen.append(project_plan.title)
+        return "output"
+
+    def _created_flags(self):
+        with open(self.csv_path, encoding="utf-8") as f:
+            return [line.split(",")[0] for line in f.read().splitlines()[1:]]
+
+    def _run(self, batch_concurrency):
+        with mock.patch.object(Config, "BATCH_CONCURRENCY", batch_concurrency):
+            self.orchestrator.process_batch(self.csv_path, "base request", self._video_processor)
+
+    def test_each_row_gets_its_own_plan(self):
+        self._run(1)
+
+        self.assertEqual(self.seen, [s for s in STYLES if s != "Tango"])
+        self.assertEqual(self._created_flags(), ["TRUE", "FALSE", "TRUE", "TRUE", "TRUE", "TRUE"])
+        self.assertLessEqual(self.director.max_in_flight, 2)
+
+    def test_concurrent_rows_get_their_own_plans(self):
+        self._run(3)
+
+        self.assertEqual(sorted(self.seen), sorted(s for s in STYLES if s != "Tango"))
+        self.assertEqual(self._created_flags(), ["TRUE", "FALSE", "TRUE", "TRUE", "TRUE", "TRUE"])
+        self.assertLessEqual(self.director.max_in_flight, 3)
+
+    def test_stopped_batch_cancels_plans_ahead(self):
+        def stop(request, *args, project_plan=None, **kwargs):
+            raise KeyboardInterrupt
+
+        with mock.patch.object(Config, "BATCH_CONCURRENCY", 1):
+            with self.assertRaises(KeyboardInterrupt):
+                self.orchestrator.process_batch(self.csv_path, "base request", stop)
+
+        self.assertEqual(self._created_flags(), ["FALSE"] * len(STYLES))
+        self.assertLessEqual(self.director.max_in_flight, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import asyncio
+import inspect
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from PIL import Image
+from google.genai import types
+from dance_loop_gen.config import Config
+from dance_loop_gen.core import models
+from dance_loop_gen.core.models import Scene, VideoPlan
+from dance_loop_gen.services import cinematographer
+from dance_loop_gen.services.cinematographer import CinematographerService
+from dance_loop_gen.utils import logger, prompt_loader
+from dance_loop_gen.utils.image_cache import KeyframeCache
+
+def _png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (8, 8), color='red').save(buffer, format="PNG")
+    return buffer.getvalue()
+
+PNG_BYTES = _png_bytes()
+
+class _FakeAioModels:
+    """Stands in for client.aio.models; records the contents of every request.
+
+    Each response carries a "response <n>" text part next to its image, so the
+    turns a later request replays can be told apart.
+    """
+    def __init__(self):
+        self.calls = []
+
+    async def generate_content(self, model, contents, config=None):
+        # Copied: the cinematographer keeps extending and trimming the same history list
+        self.calls.append(list(contents))
+        await asyncio.sleep(0)
+        return SimpleNamespace(parts=[
+            types.Part(text=f"response {len(self.calls) - 1}"),
+            types.Part.from_bytes(data=PNG_BYTES, mime_type="image/png"),
+        ])
+
+def _describe_turn(content: types.Content) -> str:
+    """Labels a history turn: "master", "edit <pose>" or the model's "response <n>"."""
+    text = content.parts[0].text
+    if content.role == "model":
+        return text
+    if text.startswith("Change the pose to:"):
+        return "edit " + text.splitlines()[0].removeprefix("Change the pose to: ")
+    return "master"
+
+def _plan(scene_count: int) -> VideoPlan:
+    return VideoPlan(
+        title="Test", description="d", backend_tags=("tag",),
+        character_leader_desc="leader", character_follower_desc="follower", setting_desc="setting",
+        scenes=[
+            Scene(scene_number=i + 1, action_description="a", audio_prompt="p",
+                  start_pose_description=f"pose {i}", end_pose_description="e")
+            for i in range(scene_count)
+        ]
+    )
+
+class TestCinematographerImports(unittest.TestCase):
+    def test_shares_package_modules(self):
+        # A second copy of these modules would mean separate classes, prompt
+        # caches and state logs for the cinematographer
+        self.assertIs(cinematographer.VideoPlan, models.VideoPlan)
+        self.assertIs(cinematographer.PromptLoader, prompt_loader.PromptLoader)
+        self.assertIs(cinematographer.save_state, logger.save_state)
+
+    def test_import_does_not_load_top_level_copies(self):
+        # Run in a fresh interpreter so modules imported by other tests don't matter
+        code = (
+            "import sys, dance_loop_gen.services.cinematographer; "
+            "print(sorted(m for m in ('core.models', 'config', 'utils.logger') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_sequential_keyframes_signature(self):
+        params = list(inspect.signature(CinematographerService._agenerate_sequential_keyframes).parameters)
+        self.assertEqual(params, ["self", "plan", "prompt_master", "previous_response_parts",
+                                  "variety_instruction", "assets", "output_dir"])
+
+class TestCinematographerAssets(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.models = _FakeAioModels()
+        # Only the aio surface is faked: every keyframe must go through it
+        self.service = CinematographerService(SimpleNamespace(aio=SimpleNamespace(models=self.models)))
+        self.patches = [
+            mock.patch.object(Config, "SAVE_STATE", False),
+            mock.patch.object(Config, "KEYFRAME_CACHE", False),
+            mock.patch.object(Config, "KEYFRAME_FORMAT", "png"),
+            mock.patch.object(Config, "PARALLEL_KEYFRAMES", False),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_generate_assets_chains_edits_through_async_client(self):
+        assets = self.service.generate_assets(_plan(3), self.output_dir)
+
+        self.assertEqual(sorted(assets), ["A", "B", "C"])
+        for path in assets.values():
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), PNG_BYTES)
+        # Keyframe C is edited from a history that carries Keyframe B's response
+        self.assertEqual(len(self.models.calls), 3)
+        self.assertEqual(len(self.models.calls[2]), 5)
+
+    def test_edit_history_keeps_keyframe_a_and_latest_edit(self):
+        self.service.generate_assets(_plan(5), self.output_dir)
+
+        # Keyframes B-E; older edit rounds are dropped once the history is full
+        self.assertEqual([len(call) for call in self.models.calls[1:]], [3, 5, 5, 5])
+        self.assertEqual(
+            [_describe_turn(content) for content in self.models.calls[-1]],
+            ["master", "response 0", "edit pose 3", "response 3", "edit pose 4"]
+        )
+
+    def test_keyframe_cache_errors_do_not_fail_generation(self):
+        self.service._keyframe_cache = KeyframeCache(os.path.join(self.output_dir, ".cache"))
+        disk_full = OSError(28, "No space left on device")
+
+        with mock.patch.object(KeyframeCache, "put", side_effect=disk_full), \
+                mock.patch.object(KeyframeCache, "get", side_effect=PermissionError(13, "Permission denied")):
+            assets = self.service.generate_assets(_plan(2), self.output_dir)
+
+        self.assertEqual(sorted(assets), ["A", "B"])
+        self.assertTrue(all(os.path.exists(path) for path in assets.values()))
+        self.assertEqual(len(self.models.calls), 2)
+
+    def test_agenerate_assets_batch_writes_one_folder_per_pose(self):
+        results = asyncio.run(self.service.agenerate_assets_batch(_plan(2), [0, 1], self.output_dir))
+
+        self.assertEqual(
+            [os.path.dirname(r["A"]) for r in results],
+            [os.path.join(self.output_dir, "pose_1"), os.path.join(self.output_dir, "pose_2")]
+        )
+        self.assertTrue(all(os.path.exists(r["B"]) for r in results))
+
+if __name__ == "__main__":
+    unittest.main()
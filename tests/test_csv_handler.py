@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from dance_loop_gen.utils.csv_handler import CSVHandler
+
+CSV_CONTENT = (
+    "Created,Style,Title (Spanish),Improve Title English,Duration,Music,Description,Keywords/Tags,Notes\n"
+    "TRUE,Bolero,Titulo 1,Title 1,18s,Guitar,Desc 1,#one #two,ignored\n"
+    "FALSE,Salsa,Titulo 2,Title 2,15s,Trumpet,Desc 2,#three,ignored\n"
+    "no,Tango,Titulo 3,Title 3,18s,Bandoneon,Desc 3,#four,ignored\n"
+)
+
+class TestCSVHandler(unittest.TestCase):
+    def setUp(self):
+        fd, self.csv_path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(CSV_CONTENT)
+
+    def tearDown(self):
+        if os.path.exists(self.csv_path):
+            os.remove(self.csv_path)
+
+    def test_read_csv_normalizes_headers(self):
+        rows = CSVHandler.read_csv(self.csv_path)
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([r.row_index for r in rows], [2, 3, 4])
+        self.assertEqual([r.created for r in rows], [True, False, False])
+        self.assertEqual(rows[0].improved_title_english, "Title 1")
+        self.assertEqual(rows[1].keywords_tags, "#three")
+
+    def test_column_plan_drops_unknown_columns(self):
+        plan = CSVHandler._column_plan(("Created", "Style", "Notes"))
+
+        self.assertEqual(plan, ((0, "created"), (1, "style")))
+
+    def test_get_pending_rows(self):
+        pending = CSVHandler.get_pending_rows(self.csv_path)
+
+        self.assertEqual([r.style for r in pending], ["Salsa", "Tango"])
+
+    def test_mark_row_completed(self):
+        CSVHandler.mark_row_completed(self.csv_path, 3)
+
+        pending = CSVHandler.get_pending_rows(self.csv_path)
+        self.assertEqual([r.style for r in pending], ["Tango"])
+
+    def test_update_session_buffers_marks_until_flush(self):
+        with CSVHandler.open_for_updates(self.csv_path, flush_every=2) as session:
+            session.mark_completed(3)
+            self.assertEqual(len(CSVHandler.get_pending_rows(self.csv_path)), 2)
+
+            session.mark_completed(4)
+            self.assertEqual(CSVHandler.get_pending_rows(self.csv_path), [])
+
+        with self.assertRaises(ValueError):
+            CSVHandler.mark_row_completed(self.csv_path, 10)
+
+    def test_update_session_keeps_edits_made_during_batch(self):
+        with CSVHandler.open_for_updates(self.csv_path) as session:
+            # A row is inserted above the pending ones and another is appended
+            with open(self.csv_path, encoding="utf-8") as f:
+                lines = f.read().splitlines(keepends=True)
+            lines.insert(2, "FALSE,Cumbia,T,T,18s,Accordion,New,#new,x\n")
+            lines.append("FALSE,Vals,T,T,18s,Piano,Appended,#end,x\n")
+            with open(self.csv_path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+
+            session.mark_completed(3)
+
+        pending = CSVHandler.get_pending_rows(self.csv_path)
+        self.assertEqual([r.style for r in pending], ["Cumbia", "Tango", "Vals"])
+
+if __name__ == "__main__":
+    unittest.main()
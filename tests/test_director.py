@@ -0,0 +1,141 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from dance_loop_gen.config import Config
+from dance_loop_gen.core.models import Scene, VideoPlan
+from dance_loop_gen.services.director import DirectorService
+from dance_loop_gen.utils.plan_cache import PlanCache
+
+def _plan_json(title: str) -> str:
+    return VideoPlan(
+        title=title, description="d", backend_tags=("tag",),
+        character_leader_desc="leader", character_follower_desc="follower", setting_desc="setting",
+        scenes=[Scene(scene_number=1, action_description="a", audio_prompt="p",
+                      start_pose_description="s", end_pose_description="e")]
+    ).model_dump_json()
+
+class _FakeAioModels:
+    """Stands in for client.aio.models; later requests finish first."""
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content(self, model, contents, config=None):
+        if contents == "bad":
+            raise ValueError("rejected")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05 / int(contents))
+        self.in_flight -= 1
+        return SimpleNamespace(text=_plan_json(f"plan {contents}"))
+
+class TestDirectorBatch(unittest.TestCase):
+    def setUp(self):
+        self.patches = [
+            mock.patch.object(Config, "SAVE_STATE", False),
+            mock.patch.object(Config, "PLAN_CACHE", False),
+            mock.patch.object(Config, "PLAN_BATCH_CONCURRENCY", 2),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.models = _FakeAioModels()
+        self.director = DirectorService(SimpleNamespace(aio=SimpleNamespace(models=self.models)))
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_generate_plans_batch_keeps_input_order(self):
+        plans = asyncio.run(self.director.generate_plans_batch(["1", "2", "3", "4"]))
+
+        self.assertEqual([p.title for p in plans], ["plan 1", "plan 2", "plan 3", "plan 4"])
+        self.assertEqual(self.models.max_in_flight, 2)
+
+    def test_generate_plans_batch_returns_failures_in_place(self):
+        plans = asyncio.run(self.director.generate_plans_batch(["1", "bad", "3"], return_exceptions=True))
+
+        self.assertEqual(plans[0].title, "plan 1")
+        self.assertIsInstance(plans[1], ValueError)
+        self.assertEqual(plans[2].title, "plan 3")
+
+class _CountingModels:
+    """Stands in for client.models and client.aio.models; counts API calls."""
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        return SimpleNamespace(text=_plan_json(f"plan {contents}"))
+
+class _CountingAioModels:
+    def __init__(self, models):
+        self.models = models
+
+    async def generate_content(self, model, contents, config=None):
+        return self.models.generate_content(model, contents, config)
+
+class TestPlanCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = PlanCache(self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_put_and_get_round_trip(self):
+        plan = VideoPlan.model_validate_json(_plan_json("cached"))
+        key = PlanCache.request_key("model", "system", "request")
+
+        self.cache.put(key, plan)
+
+        self.assertEqual(self.cache.get(key), plan)
+        self.assertNotEqual(key, PlanCache.request_key("model", "system", "other request"))
+
+    def test_unreadable_entries_are_misses(self):
+        os.mkdir(os.path.join(self.cache_dir, "directory.json"))
+        with open(os.path.join(self.cache_dir, "corrupt.json"), "w") as f:
+            f.write("{not json")
+
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertIsNone(self.cache.get("directory"))
+        self.assertIsNone(self.cache.get("corrupt"))
+
+class TestDirectorPlanCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.patches = [
+            mock.patch.object(Config, "SAVE_STATE", False),
+            mock.patch.object(Config, "PLAN_CACHE", True),
+            mock.patch.object(Config, "PLAN_CACHE_DIR", self.cache_dir),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.models = _CountingModels()
+        self.director = DirectorService(SimpleNamespace(
+            models=self.models, aio=SimpleNamespace(models=_CountingAioModels(self.models))
+        ))
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_cache_hit_makes_no_api_call(self):
+        first = self.director.generate_plan("1")
+
+        self.assertEqual(self.director.generate_plan("1"), first)
+        self.assertEqual(asyncio.run(self.director.generate_plan_async("1")), first)
+        self.assertEqual(self.models.calls, 1)
+
+    def test_cache_write_failure_keeps_the_plan(self):
+        with mock.patch.object(PlanCache, "put", side_effect=PermissionError(13, "Permission denied")):
+            plan = self.director.generate_plan("1")
+
+        self.assertEqual(plan.title, "plan 1")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import unittest
+from google.genai import types
+from dance_loop_gen.utils.image_cache import KeyframeCache, request_key
+
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + b"0" * 64
+
+class TestKeyframeCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = KeyframeCache(self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_put_and_get_round_trip_response_parts(self):
+        parts = [
+            types.Part(text="done", thought_signature=b"\x01\x02"),
+            types.Part.from_bytes(data=IMAGE_BYTES, mime_type="image/png"),
+        ]
+        self.cache.put("k", IMAGE_BYTES, parts)
+
+        image_data, cached_parts = self.cache.get("k")
+        self.assertEqual(image_data, IMAGE_BYTES)
+        self.assertEqual(cached_parts, parts)
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_link_places_image_at_destination(self):
+        self.cache.put("k", IMAGE_BYTES, [types.Part.from_bytes(data=IMAGE_BYTES, mime_type="image/png")])
+        destination = os.path.join(self.cache_dir, "keyframe_A.png")
+
+        self.cache.link("k", destination)
+
+        with open(destination, "rb") as f:
+            self.assertEqual(f.read(), IMAGE_BYTES)
+
+    def test_request_key_ignores_model_text(self):
+        def history(model_text):
+            return [
+                types.Content(role="user", parts=[types.Part(text="master")]),
+                types.Content(role="model", parts=[
+                    types.Part(text=model_text),
+                    types.Part.from_bytes(data=IMAGE_BYTES, mime_type="image/png"),
+                ]),
+                types.Content(role="user", parts=[types.Part(text="edit")]),
+            ]
+
+        self.assertEqual(request_key("m", history("a")), request_key("m", history("b")))
+        self.assertNotEqual(request_key("m", history("a")), request_key("other", history("a")))
+
+if __name__ == "__main__":
+    unittest.main()
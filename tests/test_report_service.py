@@ -72,5 +72,13 @@ class TestReportService(unittest.TestCase):
         self.assertEqual(ws.cell(row=6, column=1).value, 2)
         self.assertEqual(ws.cell(row=6, column=2).value, "[No Image]")
 
+    def test_embedded_keyframes_are_downscaled(self):
+        Image.new('RGB', (1600, 900), color='blue').save(self.test_image_file)
+
+        thumbnail = Image.open(ReportService._thumbnail(self.test_image_file))
+
+        self.assertEqual(thumbnail.format, "PNG")
+        self.assertEqual(thumbnail.size, (569, ReportService.THUMBNAIL_HEIGHT))
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,108 @@
 import csv
+import io
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dance_loop_gen.core.models import CSVRow
+from dance_loop_gen.utils.fs import write_atomic
+
+
+class CSVUpdateSession:
+    """Collects the rows a batch marks as completed and writes them to the CSV file.
+    
+    The file is parsed when the session opens to validate row indices. Marks
+    are buffered and written once every ``flush_every`` marks and when the
+    session closes. Each write re-reads the file and sets only the Created
+    flags, so edits made to the CSV while the batch runs are kept. Use it as a
+    context manager so pending marks are written even if the batch fails.
+    """
+    
+    def __init__(self, csv_path: str, flush_every: int = 1):
+        """Read the CSV file into memory.
+        
+        Args:
+            csv_path: Path to the CSV file
+            flush_every: Number of marks to buffer before rewriting the file
+        """
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+        
+        self.csv_path = csv_path
+        self.flush_every = max(1, flush_every)
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            self._fieldnames = next(reader)
+            self._rows = list(reader)
+        # Snapshot positions of rows marked since the last write
+        self._unflushed: Set[int] = set()
+        # Rows may complete on several batch worker threads at once
+        self._lock = threading.Lock()
+    
+    def mark_completed(self, row_index: int) -> None:
+        """Set the 'Created' column to TRUE for a row.
+        
+        Args:
+            row_index: The row index to update (1-indexed, including header)
+        """
+        # row_index is 1-indexed (header is 1, so index - 2 is the row in list)
+        list_index = row_index - 2
+        
+        with self._lock:
+            if not 0 <= list_index < len(self._rows):
+                raise ValueError(f"Row index {row_index} out of range (file has {len(self._rows) + 1} lines)")
+            
+            self._unflushed.add(list_index)
+            if len(self._unflushed) >= self.flush_every:
+                self._write()
+    
+    def flush(self) -> None:
+        """Write any buffered marks to the CSV file."""
+        with self._lock:
+            if self._unflushed:
+                self._write()
+    
+    @staticmethod
+    def _find_row(rows: List[List[str]], list_index: int, original: List[str]) -> Optional[List[str]]:
+        """Locate a snapshot row in the current file contents.
+        
+        The row is matched on every column except Created, at its original
+        position first, so rows inserted or reordered during the batch still
+        receive the right flag.
+        """
+        if list_index < len(rows) and rows[list_index][1:] == original[1:]:
+            return rows[list_index]
+        return next((row for row in rows if row[1:] == original[1:]), None)
+    
+    def _write(self) -> None:
+        """Set the buffered Created flags in the current CSV file (caller holds the lock)."""
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader, self._fieldnames)
+            rows = list(reader)
+        
+        for list_index in sorted(self._unflushed):
+            # Update first column (Created) - assuming it's always the first column
+            row = self._find_row(rows, list_index, self._rows[list_index])
+            if row is None:
+                print(f"Warning: Row {list_index + 2} changed in {self.csv_path}; not marking it as created")
+                continue
+            row[0] = 'TRUE'
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+        # Replaced in one step, so a crash mid-write never leaves a truncated CSV
+        write_atomic(self.csv_path, buffer.getvalue().encode('utf-8'))
+        self._unflushed.clear()
+    
+    def __enter__(self) -> "CSVUpdateSession":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
 
 
 class CSVHandler:
@@ -23,6 +123,27 @@ class CSVHandler:
         }
         
         return field_mapping.get(normalized, normalized)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _column_plan(fieldnames: Tuple[str, ...]) -> Tuple[Tuple[int, str], ...]:
+        """Map CSV header positions to CSVRow fields once per distinct header row.
+
+        Columns that do not correspond to a CSVRow field are dropped here so
+        they are never copied into the per-row dicts.
+
+        Args:
+            fieldnames: Header row exactly as read from the CSV file
+
+        Returns:
+            Tuple of (column_position, field_name) pairs for known fields
+        """
+        known_fields = CSVRow.model_fields.keys()
+        return tuple(
+            (position, normalized)
+            for position, normalized in enumerate(CSVHandler._normalize_header(h) for h in fieldnames)
+            if normalized in known_fields
+        )
     
     @staticmethod
     def read_csv(csv_path: str) -> List[CSVRow]:
@@ -38,27 +159,35 @@ class CSVHandler:
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
         rows = []
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            # Normalize headers
-            normalized_fieldnames = [CSVHandler._normalize_header(h) for h in reader.fieldnames]
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            # csv.reader tokenizes in C and yields plain lists; DictReader would build
+            # a dict keyed by every original header for each row.
+            reader = csv.reader(f)
+            fieldnames = next(reader, None)
+            if not fieldnames:
+                return rows
             
-            for idx, raw_row in enumerate(reader, start=2):  # start=2 because row 1 is header
+            # Resolve the header -> field mapping once; it is reused for every row
+            column_plan = CSVHandler._column_plan(tuple(fieldnames))
+            width = len(fieldnames)
+
+            for idx, values in enumerate(reader, start=2):  # start=2 because row 1 is header
+                if not values:
+                    continue  # Blank line; keep counting so row_index matches mark_row_completed
+                if len(values) < width:
+                    values += [None] * (width - len(values))
+
                 # Create normalized row dict
-                normalized_row = {}
-                for original_header, normalized_header in zip(reader.fieldnames, normalized_fieldnames):
-                    value = raw_row[original_header]
-                    normalized_row[normalized_header] = value
-                
+                normalized_row = {field: values[position] for position, field in column_plan}
+
                 # Convert 'created' to boolean
-                created_value = normalized_row.get('created', 'FALSE').strip().upper()
-                normalized_row['created'] = created_value in ['TRUE', '1', 'YES']
-                
+                created_value = (normalized_row.get('created') or 'FALSE').strip().upper()
+                normalized_row['created'] = created_value in ('TRUE', '1', 'YES')
+                normalized_row['row_index'] = idx
+
                 try:
-                    csv_row = CSVRow(**normalized_row)
-                    csv_row.row_index = idx
-                    rows.append(csv_row)
+                    # Validate the dict in one pass instead of kwargs + a post-init attribute assignment
+                    rows.append(CSVRow.model_validate(normalized_row))
                 except Exception as e:
                     print(f"Warning: Skipping row {idx} due to error: {e}")
                     continue
@@ -78,6 +207,19 @@ class CSVHandler:
         all_rows = CSVHandler.read_csv(csv_path)
         return [row for row in all_rows if not row.created]
     
+    @staticmethod
+    def open_for_updates(csv_path: str, flush_every: int = 1) -> CSVUpdateSession:
+        """Open a CSV file for a series of row updates.
+        
+        Args:
+            csv_path: Path to the CSV file
+            flush_every: Number of marks to buffer before rewriting the file
+            
+        Returns:
+            CSVUpdateSession holding the parsed file
+        """
+        return CSVUpdateSession(csv_path, flush_every=flush_every)
+    
     @staticmethod
     def mark_row_completed(csv_path: str, row_index: int):
         """Update the 'Created' column to TRUE for a specific row.
@@ -86,32 +228,8 @@ class CSVHandler:
             csv_path: Path to the CSV file
             row_index: The row index to update (1-indexed, including header)
         """
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
-        
-        # Read all rows using csv reader to handle quotes/commas correctly
-        rows = []
-        fieldnames = []
-        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.reader(f)
-            fieldnames = next(reader)
-            rows = list(reader)
-        
-        # Update the specific row
-        # row_index is 1-indexed (header is 1, so index - 2 is the row in list)
-        list_index = row_index - 2
-        
-        if 0 <= list_index < len(rows):
-            # Update first column (Created) - assuming it's always the first column
-            rows[list_index][0] = 'TRUE'
-            
-            # Write back using csv writer
-            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(fieldnames)
-                writer.writerows(rows)
-        else:
-            raise ValueError(f"Row index {row_index} out of range (file has {len(rows) + 1} lines)")
+        with CSVHandler.open_for_updates(csv_path) as session:
+            session.mark_completed(row_index)
     
     @staticmethod
     def create_backup(csv_path: str) -> str:
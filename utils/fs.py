@@ -0,0 +1,44 @@
+"""Filesystem helpers shared by the output-writing services."""
+
+import os
+import threading
+
+
+def ensure_dir(path: str) -> str:
+    """Create a directory (and parents) if it does not exist.
+    
+    Not memoized: the output folder may be cleared while the web server is
+    running, and an existing directory costs a single stat.
+    
+    Args:
+        path: Directory to create
+        
+    Returns:
+        The same path, for use in expressions
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def write_atomic(filepath: str, data: bytes) -> None:
+    """Write a file under a temporary name and rename it into place.
+    
+    Readers see either the previous file or the complete new one, never a
+    partial write. The temporary name is unique per process and thread, so
+    concurrent writers of the same file (e.g. two batch rows filling one cache
+    entry) never share it; the last rename wins.
+    
+    Args:
+        filepath: Destination path
+        data: File contents
+    """
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        # Don't leave a stray temporary file next to the target
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,130 @@
+"""Gemini client construction shared by the CLI and the web server."""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, TypeVar
+from dance_loop_gen.config import Config
+
+if TYPE_CHECKING:
+    import httpx
+    from google import genai
+
+T = TypeVar("T")
+
+# Image generations take tens of seconds, so keep idle connections alive well
+# past httpx's 5 second default to reuse them between a row's API calls.
+_KEEPALIVE_EXPIRY = 60.0
+
+# Transient failures (429 rate limits, 408/5xx) are retried with exponential
+# backoff and jitter so one hiccup does not abort a run and discard the
+# keyframes already generated. Other errors, e.g. 401/403, are raised at once.
+_RETRY_OPTIONS = {
+    'attempts': 5,  # Including the first call
+    'initial_delay': 2.0,
+    'max_delay': 60.0,
+    'http_status_codes': [408, 429, 500, 502, 503, 504],
+}
+
+
+def _connection_limits() -> "httpx.Limits":
+    """Size the HTTP connection pool for the configured batch concurrency.
+    
+    Returns:
+        httpx.Limits allowing a few concurrent calls per batch worker
+    """
+    import httpx
+
+    pool_size = max(20, Config.BATCH_CONCURRENCY * 4)
+    return httpx.Limits(
+        max_connections=max(100, pool_size),
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=_KEEPALIVE_EXPIRY,
+    )
+
+
+def create_client() -> "genai.Client":
+    """Create a Gemini client with a keep-alive connection pool and retries.
+    
+    google-genai is imported here rather than at module level, so callers
+    that fail configuration validation never pay its import cost.
+    
+    Returns:
+        Initialized Gemini client
+    """
+    from google import genai
+
+    limits = _connection_limits()
+    return genai.Client(http_options={
+        'api_version': Config.GEMINI_VERSION,
+        'client_args': {'limits': limits},
+        'async_client_args': {'limits': limits},
+        'retry_options': _RETRY_OPTIONS,
+    })
+
+
+def get_shared_client() -> "genai.Client":
+    """Return the process-wide Gemini client, creating it on first use.
+    
+    A new client replaces it when the API key in the environment changes, so
+    a long-running web server picks up a rotated key without a restart.
+    
+    Returns:
+        Shared Gemini client whose connection pool is reused across requests
+    """
+    Config.load()  # .env values land in os.environ here
+    return _client_for_keys(os.getenv("GOOGLE_API_KEY"), os.getenv("GEMINI_API_KEY"))
+
+
+@lru_cache(maxsize=1)
+def _client_for_keys(google_api_key: Optional[str], gemini_api_key: Optional[str]) -> "genai.Client":
+    """Create the shared client; the arguments are the environment keys genai.Client reads."""
+    return create_client()
+
+
+# Event loop that runs client.aio calls on behalf of synchronous callers
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_client_loop_lock = threading.Lock()
+
+
+def _get_client_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop for client.aio calls, starting it on first use."""
+    global _client_loop
+    with _client_loop_lock:
+        if _client_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="genai-aio", daemon=True).start()
+            _client_loop = loop
+    return _client_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared client loop and block until it finishes.
+    
+    Synchronous entry points (the CLI, batch worker threads and the web
+    server's generation task, which already runs inside an event loop) all
+    go through one long-lived loop. asyncio.run would fail inside a running
+    loop, and a fresh loop per call would strand the shared client's pooled
+    async connections on closed loops.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result (its exception is re-raised)
+    """
+    return submit(coro).result()
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """Schedule a coroutine on the shared client loop without waiting for it.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Future for the coroutine's result; cancelling it cancels the coroutine
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_client_loop())
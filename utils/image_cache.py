@@ -0,0 +1,137 @@
+"""Content-addressed on-disk cache for generated keyframe images.
+
+Each entry is a ``<key>.png`` holding the image plus a ``<key>.json`` sidecar
+with the rest of the model response (text, thought signatures), so a cached
+keyframe can continue an edit chain exactly like a live response.
+"""
+
+import base64
+import hashlib
+import os
+import shutil
+from typing import Any, List, Optional, Tuple
+from pydantic import TypeAdapter
+from google.genai import types
+from dance_loop_gen.utils.fs import ensure_dir, write_atomic
+
+_PARTS_ADAPTER = TypeAdapter(List[types.Part])
+
+
+def request_key(model: str, contents: Any, config: Optional[types.GenerateContentConfig] = None) -> str:
+    """Hash everything that determines an image request into a cache key.
+
+    Covers the model, the request config, the user prompts and every attached
+    image (reference pose and earlier keyframes). Model turns only contribute
+    their image bytes, so a chain resumed from cached keyframes produces the
+    same keys as the live run that filled the cache.
+
+    Args:
+        model: Image model name
+        contents: Request contents as passed to generate_content
+        config: Optional request config
+
+    Returns:
+        32-character hex key
+    """
+    # Non-cryptographic use: BLAKE2b is faster than SHA-256 and gives 32-char names
+    digest = hashlib.blake2b(model.encode(), digest_size=16)
+    if config is not None:
+        digest.update(config.model_dump_json(exclude_none=True).encode())
+
+    for item in contents if isinstance(contents, list) else [contents]:
+        role = item.role if isinstance(item, types.Content) else "user"
+        parts = item.parts if isinstance(item, types.Content) else [item]
+        digest.update(b"\0" + role.encode())
+        for part in parts or ():
+            if isinstance(part, str):
+                digest.update(b"\0t" + part.encode())
+            elif part.inline_data:
+                data = part.inline_data.data
+                digest.update(b"\0i" + (data if isinstance(data, bytes) else data.encode()))
+            elif part.text and role != "model":
+                digest.update(b"\0t" + part.text.encode())
+
+    return digest.hexdigest()
+
+
+class KeyframeCache:
+    """Stores generated keyframes by request key in a single directory."""
+
+    def __init__(self, cache_dir: str):
+        """Create the cache directory if needed.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+        """
+        self.cache_dir = ensure_dir(cache_dir)
+
+    def image_path(self, key: str) -> str:
+        """Path of the cached image for a key (it may not exist)."""
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def get(self, key: str) -> Optional[Tuple[bytes, List[types.Part]]]:
+        """Look up a cached keyframe.
+
+        Args:
+            key: Key from request_key
+
+        Returns:
+            (image_bytes, response_parts) or None on a miss. Entries without a
+            parts sidecar yield a single image Part built from the bytes.
+        """
+        try:
+            with open(self.image_path(key), "rb") as f:
+                image_data = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "rb") as f:
+                parts = _PARTS_ADAPTER.validate_json(f.read())
+        except (FileNotFoundError, ValueError):
+            return image_data, [types.Part.from_bytes(data=image_data, mime_type="image/png")]
+
+        # The sidecar stores the image part without its data; put the bytes back
+        parts = [
+            part.model_copy(update={"inline_data": part.inline_data.model_copy(update={"data": image_data})})
+            if part.inline_data else part
+            for part in parts
+        ]
+        return image_data, parts
+
+    def put(self, key: str, image_data: Any, parts: List[types.Part]) -> None:
+        """Store a keyframe image and its response parts.
+
+        Both files are written under temporary names and renamed into place, so
+        a reader never sees a partial entry.
+
+        Args:
+            key: Key from request_key
+            image_data: Image bytes, or the base64 string the SDK returned
+            parts: Response parts the image came from
+        """
+        if isinstance(image_data, str):
+            image_data = base64.b64decode(image_data)
+        stripped = [
+            part.model_copy(update={"inline_data": part.inline_data.model_copy(update={"data": None})})
+            if part.inline_data else part
+            for part in parts
+        ]
+        # Sidecar first: an image without its sidecar still reads back as a plain image part
+        write_atomic(os.path.join(self.cache_dir, f"{key}.json"), _PARTS_ADAPTER.dump_json(stripped, exclude_none=True))
+        write_atomic(self.image_path(key), image_data)
+
+    def link(self, key: str, destination: str) -> None:
+        """Place a cached image at destination, hard-linking when possible.
+
+        Args:
+            key: Key of an entry known to exist
+            destination: Target file path (replaced if present)
+        """
+        source = self.image_path(key)
+        try:
+            if os.path.lexists(destination):
+                os.remove(destination)
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
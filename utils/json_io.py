@@ -0,0 +1,38 @@
+"""JSON encoding helpers backed by pydantic-core's compiled serializer."""
+
+from typing import Any, Optional
+from pydantic_core import to_json
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+    
+    Pydantic models, dataclasses, dicts, lists and tuples are encoded natively
+    without a Python-level object walk. Values JSON cannot represent fall back
+    to their ``str()`` form, matching ``json.dumps(..., default=str)``.
+    
+    Args:
+        obj: Object to serialize
+        indent: Optional indentation for pretty-printed output
+        
+    Returns:
+        JSON document as bytes (non-ASCII characters are not escaped)
+    """
+    return to_json(obj, indent=indent, fallback=str)
+
+
+def write_json(path: str, obj: Any, indent: Optional[int] = 2) -> str:
+    """Write an object to a UTF-8 JSON file terminated by a newline.
+    
+    Args:
+        path: Destination file path (overwritten if it exists)
+        obj: Object to serialize
+        indent: Indentation for pretty-printed output, or None for compact
+        
+    Returns:
+        The path that was written
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent))
+        f.write(b"\n")
+    return path
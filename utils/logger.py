@@ -1,15 +1,30 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-import json
+import threading
 from datetime import datetime
 from typing import Any, Dict, Optional
 from rich.console import Console
+from dance_loop_gen.config import Config
+from dance_loop_gen.utils.json_io import dumps
 
 # Module-level state for run directory
 _current_run_dir: Optional[str] = None
 _run_id: Optional[str] = None
 
+# Per-run state log: one append-only JSONL file, opened once and flushed periodically.
+# Records are written by a background thread so callers never wait on the file.
+_STATE_FILENAME = "state.jsonl"
+_STATE_BUFFER_SIZE = 1 << 20
+_STATE_FLUSH_EVERY = 16
+_state_file = None
+_state_unflushed = 0
+_state_lock = threading.Lock()
+_state_queue: "queue.Queue[bytes]" = queue.Queue()
+_state_writer: Optional[threading.Thread] = None
+
 # Global Rich console instance
 console = Console()
 
@@ -29,13 +44,84 @@ def get_run_dir() -> str:
     global _current_run_dir
     if _current_run_dir is None:
         run_id = get_run_id()
-        _current_run_dir = os.path.join(get_log_dir(), f"run_{run_id}")
-        os.makedirs(_current_run_dir, exist_ok=True)
+        run_dir = os.path.join(get_log_dir(), f"run_{run_id}")
+        # Publish the path only once the directory exists (the state writer thread reads it too)
+        os.makedirs(run_dir, exist_ok=True)
+        _current_run_dir = run_dir
     return _current_run_dir
 
-def save_state(step_name: str, state: Dict[str, Any], logger: Optional[logging.Logger] = None) -> str:
+def _get_state_file():
+    """Open the run's state log on first use (caller holds _state_lock)."""
+    global _state_file
+    if _state_file is None:
+        _state_file = open(os.path.join(get_run_dir(), _STATE_FILENAME), "ab", buffering=_STATE_BUFFER_SIZE)
+    return _state_file
+
+def _write_state_records() -> None:
+    """Background loop appending queued state records to the state log."""
+    global _state_unflushed
+    while True:
+        records = [_state_queue.get()]
+        # Drain whatever else is already queued so bursts are written together
+        while True:
+            try:
+                records.append(_state_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with _state_lock:
+                state_file = _get_state_file()
+                for record in records:
+                    state_file.write(record)
+                _state_unflushed += len(records)
+                if _state_unflushed >= _STATE_FLUSH_EVERY:
+                    state_file.flush()
+                    _state_unflushed = 0
+        except Exception as e:
+            print(f"Warning: Could not write state records: {e}", file=sys.stderr)
+        finally:
+            for _ in records:
+                _state_queue.task_done()
+
+def _ensure_state_writer() -> None:
+    """Start the state writer thread on first use."""
+    global _state_writer
+    if _state_writer is None:
+        with _state_lock:
+            if _state_writer is None:
+                _state_writer = threading.Thread(target=_write_state_records, name="state-writer", daemon=True)
+                _state_writer.start()
+                # Drain the queue before exit; the daemon writer is still alive when atexit runs
+                atexit.register(close_state_file)
+
+def flush_state() -> None:
+    """Wait for queued state records and flush them to disk."""
+    global _state_unflushed
+    _state_queue.join()
+    with _state_lock:
+        if _state_file is not None:
+            _state_file.flush()
+        _state_unflushed = 0
+
+def close_state_file() -> None:
+    """Write any queued records, then flush and close the run's state log."""
+    global _state_file, _state_unflushed
+    _state_queue.join()
+    with _state_lock:
+        if _state_file is not None:
+            _state_file.close()
+            _state_file = None
+        _state_unflushed = 0
+
+def save_state(step_name: str, state: Dict[str, Any], logger: Optional[logging.Logger] = None) -> Optional[str]:
     """
-    Save application state to a JSON file.
+    Append an application state snapshot to the run's JSONL state log.
+    
+    All snapshots of a run go to a single ``state.jsonl`` file that is opened
+    once and written through a large buffer; it is flushed every
+    ``_STATE_FLUSH_EVERY`` records and at interpreter exit (or via
+    ``flush_state()``). The state is serialized immediately, but the write is
+    handed to a background thread. Does nothing when ``Config.SAVE_STATE`` is off.
     
     Args:
         step_name: Name of the current step (e.g., 'plan_generated', 'keyframe_a')
@@ -43,12 +129,12 @@ def save_state(step_name: str, state: Dict[str, Any], logger: Optional[logging.L
         logger: Optional logger for logging the save operation
     
     Returns:
-        Path to the saved state file
+        Path to the state log file, or None if state saving is disabled
     """
-    run_dir = get_run_dir()
+    if not Config.SAVE_STATE:
+        return None
+    
     timestamp = datetime.now().strftime("%H%M%S")
-    filename = f"state_{timestamp}_{step_name}.json"
-    filepath = os.path.join(run_dir, filename)
     
     # Convert non-serializable objects to strings
     def serialize(obj: Any) -> Any:
@@ -63,19 +149,17 @@ def save_state(step_name: str, state: Dict[str, Any], logger: Optional[logging.L
         elif isinstance(obj, bytes):
             return f"<bytes: {len(obj)} bytes>"
         else:
-            try:
-                json.dumps(obj)
-                return obj
-            except (TypeError, ValueError):
-                return str(obj)
+            # Leaf values go straight to the encoder, which falls back to str()
+            return obj
     
-    serialized_state = serialize(state)
+    record = dumps({"step": step_name, "timestamp": timestamp, "state": serialize(state)}) + b"\n"
     
-    with open(filepath, 'w') as f:
-        json.dump(serialized_state, f, indent=2, default=str)
+    filepath = os.path.join(get_run_dir(), _STATE_FILENAME)
+    _ensure_state_writer()
+    _state_queue.put(record)
     
     if logger:
-        logger.info(f"State saved: {filepath}")
+        logger.info(f"State saved: {step_name}")
     
     return filepath
 
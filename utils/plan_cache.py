@@ -0,0 +1,70 @@
+"""On-disk cache of director plans for repeated requests.
+
+Plans are stored as JSON, keyed by a hash of the text model, the director's
+system instruction and the user request. Editing the outfit, setting or
+system prompt files changes the system instruction, so earlier entries are
+simply no longer matched.
+"""
+
+import hashlib
+import os
+from typing import Optional
+from dance_loop_gen.core.models import VideoPlan
+from dance_loop_gen.utils.fs import ensure_dir, write_atomic
+
+
+class PlanCache:
+    """Stores generated VideoPlans by request key in a single directory."""
+
+    def __init__(self, cache_dir: str):
+        """Create the cache directory if needed.
+
+        Args:
+            cache_dir: Directory holding the cached plans
+        """
+        self.cache_dir = ensure_dir(cache_dir)
+
+    @staticmethod
+    def request_key(model: str, system_instruction: str, user_input: str) -> str:
+        """Hash the inputs that determine a plan into a cache key.
+
+        Args:
+            model: Text model name
+            system_instruction: Director system instruction, or a digest of it
+            user_input: User request sent to the model
+
+        Returns:
+            32-character hex key
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for value in (model, system_instruction, user_input):
+            digest.update(value.encode() + b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[VideoPlan]:
+        """Look up a cached plan.
+
+        Args:
+            key: Key from request_key
+
+        Returns:
+            The cached VideoPlan, or None on a miss or an unreadable entry
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                return VideoPlan.model_validate_json(f.read())
+        except (OSError, ValueError):
+            # Missing, unreadable (permissions, a directory in the way) or corrupt
+            return None
+
+    def put(self, key: str, plan: VideoPlan) -> None:
+        """Store a plan under key.
+
+        Args:
+            key: Key from request_key
+            plan: Plan to cache
+        """
+        write_atomic(self._path(key), plan.model_dump_json(indent=2).encode())
@@ -1,13 +1,20 @@
 import os
 import mimetypes
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from dance_loop_gen.config import Config
 
 class PromptLoader:
     @staticmethod
+    @lru_cache(maxsize=64)
     def load(filename: str) -> str:
-        """Loads a prompt text file from the configured prompts directory."""
-        from config import Config  # Lazy import to avoid circular dependency
+        """Loads a prompt text file from the configured prompts directory.
         
+        Results are cached per filename for the life of the process; call
+        PromptLoader.load.cache_clear() after editing prompt files at runtime.
+        Missing files are not cached.
+        """
         path = os.path.join(Config.PROMPTS_DIR, filename)
         if not os.path.exists(path):
             raise FileNotFoundError(f"Prompt file not found: {path}")
@@ -47,8 +54,6 @@ class PromptLoader:
         Returns:
             Tuple of (image_bytes, mime_type) if file exists, None otherwise.
         """
-        from config import Config  # Lazy import to avoid circular dependency
-        
         path = os.path.join(Config.PROMPTS_DIR, filename)
         
         # Check for exact match first
@@ -76,6 +81,39 @@ class PromptLoader:
             
         return (image_bytes, mime_type) if image_bytes else None
 
+    @staticmethod
+    def _read_image(path: str) -> Optional[Tuple[bytes, str]]:
+        """Reads one image file, returning None for non-images, empty or unreadable files."""
+        # Determine MIME type
+        mime_type, _ = mimetypes.guess_type(path)
+        if not mime_type or not mime_type.startswith('image/'):
+            return None
+            
+        try:
+            with open(path, "rb") as f:
+                image_bytes = f.read()
+        except Exception:
+            return None
+            
+        return (image_bytes, mime_type) if image_bytes else None
+
+    @staticmethod
+    def _read_images(paths: List[str]) -> list:
+        """Reads several image files concurrently, keeping the order of paths.
+        
+        Args:
+            paths: Image file paths, already sorted
+            
+        Returns:
+            List of tuples of (image_bytes, mime_type) for the readable images.
+        """
+        if len(paths) <= 1:
+            results = map(PromptLoader._read_image, paths)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                results = list(executor.map(PromptLoader._read_image, paths))
+        return [image for image in results if image]
+
     @staticmethod
     def load_images_from_directory(directory: str) -> list:
         """Loads all image files from a specific directory.
@@ -105,23 +143,7 @@ class PromptLoader:
         # Sort to ensure consistent ordering
         matching_files.sort()
         
-        images = []
-        for path in matching_files:
-            # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(path)
-            if not mime_type or not mime_type.startswith('image/'):
-                continue
-                
-            try:
-                with open(path, "rb") as f:
-                    image_bytes = f.read()
-                    
-                if image_bytes:
-                    images.append((image_bytes, mime_type))
-            except Exception:
-                continue
-                
-        return images
+        return PromptLoader._read_images(matching_files)
 
     @staticmethod
     def load_multiple_images(pattern: str) -> list:
@@ -139,7 +161,6 @@ class PromptLoader:
             List of tuples of (image_bytes, mime_type), sorted by filename.
             Empty list if no matching files found.
         """
-        from config import Config  # Lazy import to avoid circular dependency
         import glob
         
         # Build search pattern for numbered files
@@ -154,22 +175,6 @@ class PromptLoader:
         # Sort to ensure consistent ordering (1, 2, 3, ...)
         matching_files.sort()
         
-        images = []
-        for path in matching_files:
-            # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(path)
-            if not mime_type or not mime_type.startswith('image/'):
-                continue
-                
-            try:
-                with open(path, "rb") as f:
-                    image_bytes = f.read()
-                    
-                if image_bytes:
-                    images.append((image_bytes, mime_type))
-            except Exception:
-                continue
-                
-        return images
+        return PromptLoader._read_images(matching_files)
 
 
@@ -10,7 +10,6 @@ from datetime import datetime
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks, UploadFile, File
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
-from google import genai
 from pydantic import BaseModel
 
 from dance_loop_gen.config import Config
@@ -22,6 +21,7 @@ from dance_loop_gen.services.batch_orchestrator import BatchOrchestrator
 from dance_loop_gen.services.video_processor import VideoProcessor
 from dance_loop_gen.services.report_service import ReportService
 from dance_loop_gen.utils.prompt_loader import PromptLoader
+from dance_loop_gen.utils.genai_client import get_shared_client
 from dance_loop_gen.utils.logger import setup_logger, get_run_dir
 from dance_loop_gen.web.api_models import (
     ConfigRequest, ConfigResponse, GenerateSingleRequest, 
@@ -74,7 +74,7 @@ progress_manager = ProgressManager()
 
 # Service initialization helper
 def get_services():
-    client = genai.Client(http_options={'api_version': Config.GEMINI_VERSION})
+    client = get_shared_client()
     director = DirectorService(client)
     cinematographer = CinematographerService(client)
     veo = VeoService()
@@ -184,6 +184,9 @@ async def update_config(req: ConfigRequest):
             meta_content = f"# Metadata Configuration\n\nlanguage: {req.metadata_language or 'Spanish'}\ntarget_keywords: {', '.join(req.target_keywords) if req.target_keywords else ''}\n"
             with open(PROMPTS_DIR / "metadata_config.txt", "w") as f:
                 f.write(meta_content)
+        
+        # Prompt files may have been rewritten; drop cached contents
+        PromptLoader.load.cache_clear()
                 
         return {"status": "success"}
     except Exception as e:
@@ -232,7 +235,8 @@ async def run_generation_task(req: GenerateSingleRequest):
         res_dir = Path(output_dir)
         keyframes = []
         for f in res_dir.iterdir():
-            if f.suffix == ".png" and "keyframe" in f.name:
+            # Keyframes are .webp when KEYFRAME_FORMAT=webp
+            if f.suffix in (".png", ".webp") and "keyframe" in f.name:
                 keyframes.append(KeyframeAsset(
                     scene=f.stem.split("_")[-1].upper(),
                     filename=f.name,
@@ -275,7 +279,7 @@ async def list_outputs():
         return []
         
     for d in sorted(OUTPUT_DIR.iterdir(), key=os.path.getmtime, reverse=True):
-        if d.is_dir():
+        if d.is_dir() and not d.name.startswith("."):  # Skip .keyframe_cache
             # Look for a thumbnail (keyframe A)
             thumb = None
             for f in d.iterdir():